@@ -1,9 +1,21 @@
 import json
 import time
-from datetime import datetime, timedelta, date
+import bisect
+import re
+import copy
+import math
+import random
+import argparse
+import csv
+import os
+import sys
+from collections import defaultdict, deque
+from datetime import datetime, timedelta, date, timezone
 import tkinter as tk
 from tkinter import messagebox, filedialog
 import threading
+import numpy as np
+import requests
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
@@ -17,6 +29,12 @@ import logging
 import winsound
 from tkcalendar import Calendar, DateEntry
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet dışa aktarma isteğe bağlıdır
+    pa = pq = None
+
 # Logging ayarları
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -24,10 +42,73 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 GUBRELEME_DATA_FILE = "gubreleme_data.json"
 ILACLAMA_DATA_FILE = "ilaclama_data.json"
 GENEL_AYARLAR_FILE = "genel_ayarlar.json"
+TARIMSAL_TOPLAMLAR_FILE = "tarimsal_toplamlar.json"
+GOZLEM_GECMISI_FILE = "gozlem_gecmisi.jsonl"  # Her satır bir gözlem (JSON Lines)
+ISLEM_GECMISI_FILE = "islem_gecmisi.jsonl"  # Her satır bir gübreleme/ilaçlama kaydı
+PARSELLER_DATA_FILE = "parseller.json"
+KONUM_INDEKSI_FILE = "konum_indeksi.json"  # MGM'den yenilenen il -> ilçe listeleri
+ILCELER_DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ilceler.json")  # Uygulamayla gelen il -> ilçe listesi
+TAHMIN_ONBELLEK_FILE = "tahmin_onbellek.json"  # konum -> son çekilen tahmin
 
 # Sabitler
 HAVA_DURUMU_PARAMETRELERI = ["Sıcaklık", "Hava Durumu", "Yağmur", "Nem", "Rüzgar Hızı", "Rakım", "Gün Doğumu", "Gün Batımı"]
 
+IL_LISTESI = [
+    "Adana", "Adıyaman", "Afyonkarahisar", "Ağrı", "Aksaray", "Amasya", "Ankara", "Antalya", "Ardahan", "Artvin",
+    "Aydın", "Balıkesir", "Bartın", "Batman", "Bayburt", "Bilecik", "Bingöl", "Bitlis", "Bolu", "Burdur",
+    "Bursa", "Çanakkale", "Çankırı", "Çorum", "Denizli", "Diyarbakır", "Düzce", "Edirne", "Elazığ", "Erzincan",
+    "Erzurum", "Eskişehir", "Gaziantep", "Giresun", "Gümüşhane", "Hakkari", "Hatay", "Iğdır", "Isparta", "İstanbul",
+    "İzmir", "Kahramanmaraş", "Karabük", "Karaman", "Kars", "Kastamonu", "Kayseri", "Kilis", "Kırıkkale", "Kırklareli",
+    "Kırşehir", "Kocaeli", "Konya", "Kütahya", "Malatya", "Manisa", "Mardin", "Mersin", "Muğla", "Muş",
+    "Nevşehir", "Niğde", "Ordu", "Osmaniye", "Rize", "Sakarya", "Samsun", "Şanlıurfa", "Siirt", "Sinop",
+    "Sivas", "Şırnak", "Tekirdağ", "Tokat", "Trabzon", "Tunceli", "Uşak", "Van", "Yalova", "Yozgat",
+    "Zonguldak",
+]
+
+# Gözlem akışından artımlı hesaplanan tarımsal değerler (hatırlatıcılarda da kullanılabilir)
+TARIMSAL_PARAMETRELER = [
+    "GDD (Gübreleme)", "Yağış (Gübreleme)", "GDD (İlaçlama)", "Yağış (İlaçlama)",
+    "Sıcaklık Min (24s)", "Sıcaklık Maks (24s)", "Nem Ort (24s)", "Nem Min (24s)", "Nem Maks (24s)",
+    "Rüzgar Ort (24s)", "Rüzgar Maks (24s)",
+]
+HATIRLATICI_PARAMETRELERI = HAVA_DURUMU_PARAMETRELERI + TARIMSAL_PARAMETRELER
+METIN_PARAMETRELERI = ("Hava Durumu", "Gün Doğumu", "Gün Batımı")
+GDD_TABAN_SICAKLIK = 10.0  # Büyüme derece günü için taban sıcaklık (°C)
+KAYAN_PENCERE_SURESI = 24 * 3600  # saniye
+MAKS_GOZLEM_ARALIGI = 3 * 3600  # Bundan uzun boşluklar GDD'ye en fazla bu kadar katkı yapar
+TOPLAM_KAYIT_ARALIGI = 15 * 60  # Toplamlar her gözlemde değil, bu aralıkla (ve çıkışta) diske yazılır
+
+# Tahmine dayalı ilaçlama/gübreleme penceresi planlaması
+MGM_SERVIS_URL = "https://servis.mgm.gov.tr/web"
+TAHMIN_ADIMI = 3 * 3600  # MGM saatlik tahminleri 3 saatlik adımlarla verir
+TAHMIN_UZUNLUGU = 40  # Ortak zaman eksenindeki adım sayısı (5 gün)
+TAHMIN_GUNCELLEME_ARALIGI = 3 * 3600
+TAHMIN_PARTISI = 20  # Her güncellemede en fazla bu kadar konumun tahmini yenilenir
+YAGISLI_HADISELER = {"HY", "Y", "KY", "KKY", "HKY", "K", "YKY", "HSY", "SY", "KSY", "MSY", "DY", "GSY", "KGY"}
+ANA_PARSEL_ADI = "Ana Tarla"
+PLANLAMA_KURALLARI = {
+    "ilaclama": {"maks_ruzgar": 15, "min_sicaklik": 5, "maks_sicaklik": 28, "yagissiz_saat": 24},
+    "gubreleme": {"maks_ruzgar": 25, "min_sicaklik": 2, "maks_sicaklik": 35, "yagissiz_saat": 12},
+}
+
+# Dışa aktarma (gözlem parametresi -> sütun adı); metin dışındaki değerler sayıya çevrilir
+DISA_AKTARMA_GOZLEM_SUTUNLARI = {
+    "Sıcaklık": "sicaklik_c", "Hava Durumu": "hava_durumu", "Yağmur": "yagis_mm", "Nem": "nem_yuzde",
+    "Rüzgar Hızı": "ruzgar_kmsa", "Rakım": "rakim_m", "Gün Doğumu": "gun_dogumu", "Gün Batımı": "gun_batimi",
+}
+DISA_AKTARMA_PARCA_BOYUTU = 5000  # Belleğe alınan en fazla satır sayısı
+
+HATIRLATICI_TIPLERI = ["altinda", "ustunde", "esit"]
+HATIRLATICI_TEKRARLARI = ["Bir Kez", "Günlük", "Haftalık", "Aylık"]
+HATIRLATICI_SUTUNLARI = ["Parametre", "Tip", "Değer", "Durum", "Tekrar"]
+HATIRLATICI_SUTUN_GENISLIKLERI = [95, 60, 45, 45, 65]
+
+# Çoklu konum panosu
+PANO_SUTUNLARI = ["Konum", "Sıcaklık", "Yağmur", "Nem", "Rüzgar Hızı"]
+PANO_SUTUN_GENISLIKLERI = [120, 55, 55, 45, 70]
+PANO_GORUNUR_SATIR = 6
+KONUM_GUNCELLEME_PARTISI = 25  # Her periyodik güncellemede çekilen izlenen konum sayısı
+
 # Renk paleti
 COLOR_PRIMARY = "#388E3C"
 COLOR_SECONDARY = "#66BB6A"
@@ -79,24 +160,116 @@ def save_ilaclama_data(data):
     save_data(ILACLAMA_DATA_FILE, data)
 
 
+def load_konum_indeksi():
+    # Uygulamayla gelen liste temel alınır; MGM'den yenilenen illerin listeleri bunun üzerine yazılır
+    try:
+        with open(ILCELER_DATA_FILE, "r", encoding="utf-8") as file:
+            ilceler = json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        logging.error(f"{ILCELER_DATA_FILE} okunamadı, ilçeler doğrulanamayacak: {e}")
+        ilceler = {}
+    ilceler.update(load_data(KONUM_INDEKSI_FILE, {}))
+    return ilceler
+
+def save_konum_indeksi(data):
+    save_data(KONUM_INDEKSI_FILE, data)
+
+def load_tahminler():
+    return load_data(TAHMIN_ONBELLEK_FILE, {})
+
+def save_tahminler(data):
+    save_data(TAHMIN_ONBELLEK_FILE, data)
+
+def load_parseller(konum_indeksi=None):
+    parseller = load_data(PARSELLER_DATA_FILE, [])
+    gecerli = [parsel for parsel in parseller if isinstance(parsel, dict) and all(alan in parsel for alan in ("ad", "il", "ilce"))]
+    if len(gecerli) != len(parseller):
+        logging.warning(f"{PARSELLER_DATA_FILE} içinde ad/il/ilce alanı eksik {len(parseller) - len(gecerli)} parsel atlandı.")
+    if konum_indeksi is not None:
+        # Konumlar indeksteki yazımlarına çevrilir ("kadikoy" -> "Kadıköy"); tahmin önbelleği anahtarları ve
+        # MGM sorguları hep aynı adı kullanır. Çözülemeyenler olduğu gibi kalır ve tahmin çekilirken loglanır.
+        for parsel in gecerli:
+            il, _ = konum_indeksi.il_coz(parsel["il"])
+            ilce = konum_indeksi.ilce_coz(il, parsel["ilce"])[0] if il else None
+            if ilce:
+                parsel["il"], parsel["ilce"] = il, ilce
+    return gecerli
+
+
 def load_genel_ayarlar():
     default_ayarlar = {
         "hava_durumu": {},
         "secilen_hava_durumu": [],
         "il": "İstanbul",
         "ilce": "Kadıköy",
-        "hatirlaticilar": {parametre: [] for parametre in HAVA_DURUMU_PARAMETRELERI}
+        "hatirlaticilar": {parametre: [] for parametre in HATIRLATICI_PARAMETRELERI},
+        "izlenen_konumlar": [],
+        "konum_hava_durumu": {},
     }
     ayarlar = load_data(GENEL_AYARLAR_FILE, default_ayarlar)
 
-    for parametre in HAVA_DURUMU_PARAMETRELERI:
+    for parametre in HATIRLATICI_PARAMETRELERI:
         ayarlar["hatirlaticilar"].setdefault(parametre, [])
+    ayarlar.setdefault("izlenen_konumlar", [])
+    ayarlar.setdefault("konum_hava_durumu", {})
+    ayarlar.pop("tahminler", None)  # Tahminler artık TAHMIN_ONBELLEK_FILE içinde tutulur
+
+    # Eski kayıtlardaki hatırlatıcılara kalıcı kimlik ata
+    son_id = ayarlar.get("hatirlatici_son_id", 0)
+    for hatirlaticilar in ayarlar["hatirlaticilar"].values():
+        for hatirlatici in hatirlaticilar:
+            if "id" in hatirlatici:
+                son_id = max(son_id, hatirlatici["id"])
+    for hatirlaticilar in ayarlar["hatirlaticilar"].values():
+        for hatirlatici in hatirlaticilar:
+            if "id" not in hatirlatici:
+                son_id += 1
+                hatirlatici["id"] = son_id
+    ayarlar["hatirlatici_son_id"] = son_id
     return ayarlar
 
 
 def save_genel_ayarlar(data):
     save_data(GENEL_AYARLAR_FILE, data)
 
+def load_tarimsal_toplamlar():
+    return load_data(TARIMSAL_TOPLAMLAR_FILE, {})
+
+def save_tarimsal_toplamlar(data):
+    save_data(TARIMSAL_TOPLAMLAR_FILE, data)
+
+def kayit_ekle(filename, kayit):
+    try:
+        with open(filename, "a", encoding="utf-8") as file:
+            file.write(json.dumps(kayit, ensure_ascii=False) + "\n")
+    except Exception as e:
+        logging.error(f"{filename} dosyasına yazarken hata: {e}")
+
+def gozlem_kaydet(il, ilce, hava_durumu, zaman=None):
+    kayit_ekle(GOZLEM_GECMISI_FILE, {
+        "zaman": (zaman or datetime.now()).isoformat(timespec="seconds"),
+        "il": il,
+        "ilce": ilce,
+        "hava_durumu": hava_durumu,
+    })
+
+def islem_kaydet(il, ilce, islem, zaman=None):
+    kayit_ekle(ISLEM_GECMISI_FILE, {
+        "zaman": (zaman or datetime.now()).isoformat(timespec="seconds"),
+        "il": il,
+        "ilce": ilce,
+        "islem": islem,
+    })
+
+def sayisal_deger(metin):
+    # "12,5°C", "3 mm", "45 %" gibi metinlerden sayıyı çıkarır; sayı yoksa None döner
+    if metin is None:
+        return None
+    if isinstance(metin, (int, float)):
+        return float(metin)
+    eslesme = re.search(r"-?\d+(?:[.,]\d+)?", metin)
+    return float(eslesme.group().replace(",", ".")) if eslesme else None
+
 def play_notification_sound():
     if platform.system() == "Windows":
         try:
@@ -104,6 +277,871 @@ def play_notification_sound():
         except Exception as e:
             logging.error(f"Ses çalma hatası: {e}")
 
+def konum_anahtari(il, ilce):
+    return f"{il}/{ilce}"
+
+def turkce_normalize(metin):
+    # Büyük/küçük harf ve noktalı/noktasız i farkını yok sayan karşılaştırma anahtarı
+    metin = metin.strip().replace("I", "ı").replace("İ", "i").lower()
+    return metin.translate(str.maketrans("çğıöşüâîû", "cgiosuaiu"))
+
+
+class KonumTrie:
+    # Türkçe normalize edilmiş adlarla anahtarlanan önek ağacı; tam eşleşme, önek tamamlama
+    # ve sınırlı düzenleme uzaklığıyla (Levenshtein) benzer ad araması yapar.
+    def __init__(self, adlar=()):
+        self.kok = {}
+        for ad in adlar:
+            self.ekle(ad)
+
+    def ekle(self, ad):
+        dugum = self.kok
+        for harf in turkce_normalize(ad):
+            dugum = dugum.setdefault(harf, {})
+        dugum["$"] = ad
+
+    def _dugum(self, metin):
+        dugum = self.kok
+        for harf in turkce_normalize(metin):
+            dugum = dugum.get(harf)
+            if dugum is None:
+                return None
+        return dugum
+
+    def bul(self, metin):
+        dugum = self._dugum(metin)
+        return dugum.get("$") if dugum else None
+
+    def tamamla(self, onek, limit=5):
+        dugum = self._dugum(onek)
+        if dugum is None:
+            return []
+        sonuclar = []
+        yigin = [dugum]
+        while yigin and len(sonuclar) < limit:
+            dugum = yigin.pop()
+            for harf in sorted(dugum, reverse=True):
+                if harf == "$":
+                    sonuclar.append(dugum["$"])
+                else:
+                    yigin.append(dugum[harf])
+        return sonuclar[:limit]
+
+    def benzerler(self, metin, maks_uzaklik=2, limit=5):
+        hedef = turkce_normalize(metin)
+        sonuclar = []
+
+        def gez(dugum, harf, onceki_satir):
+            satir = [onceki_satir[0] + 1]
+            for i in range(1, len(hedef) + 1):
+                satir.append(min(satir[i - 1] + 1, onceki_satir[i] + 1, onceki_satir[i - 1] + (hedef[i - 1] != harf)))
+            if "$" in dugum and satir[-1] <= maks_uzaklik:
+                sonuclar.append((satir[-1], dugum["$"]))
+            # Satırın en küçüğü sınırı aşıyorsa bu daldaki hiçbir ad yeterince yakın olamaz
+            if min(satir) <= maks_uzaklik:
+                for sonraki, alt in dugum.items():
+                    if sonraki != "$":
+                        gez(alt, sonraki, satir)
+
+        ilk_satir = list(range(len(hedef) + 1))
+        for harf, alt in self.kok.items():
+            if harf != "$":
+                gez(alt, harf, ilk_satir)
+        return [ad for _, ad in sorted(sonuclar)[:limit]]
+
+
+class KonumIndeksi:
+    # İl adları sabit listeden, ilçe adları ILCELER_DATA_FILE'dan (varsa MGM'den yenilenmiş hâliyle) gelir.
+    def __init__(self, ilceler=None):
+        self.iller = KonumTrie(IL_LISTESI)
+        self.ilceler = {}
+        for il, ilce_listesi in (ilceler or {}).items():
+            self.ilceleri_ekle(il, ilce_listesi)
+
+    def ilceleri_ekle(self, il, ilce_listesi):
+        self.ilceler[il] = KonumTrie(ilce_listesi)
+
+    def il_coz(self, metin):
+        return self._coz(self.iller, metin)
+
+    def ilce_coz(self, il, metin):
+        trie = self.ilceler.get(il)
+        if trie is None:
+            # Bu ilin ilçe listesi yok; ilçe doğrulanamaz
+            return metin.strip(), []
+        return self._coz(trie, metin)
+
+    @staticmethod
+    def _coz(trie, metin):
+        # (kanonik ad, []) veya eşleşme yoksa (None, öneriler) döndürür
+        tam = trie.bul(metin)
+        if tam:
+            return tam, []
+        adaylar = trie.tamamla(metin, limit=5) if metin.strip() else []
+        if len(adaylar) == 1:
+            return adaylar[0], []
+        return None, adaylar or trie.benzerler(metin)
+
+
+class HatirlaticiDeposu:
+    # genel_ayarlar["hatirlaticilar"] üzerinde kalıcı kimlikli kurallar ve bellek içi arama indeksi.
+    # Listeler yine parametreye göre JSON'a kaydedilir, indeks her değişiklikte artımlı güncellenir.
+    def __init__(self, ayarlar):
+        self.ayarlar = ayarlar
+        self.kurallar = {}  # id -> (parametre, hatirlatici)
+        self.indeks = {alan: defaultdict(set) for alan in ("parametre", "tip", "aktif", "tekrar")}
+        self.degerler = []  # (deger, id) çiftleri, eşik aralığı sorguları için sıralı
+        for parametre, hatirlaticilar in ayarlar["hatirlaticilar"].items():
+            for hatirlatici in hatirlaticilar:
+                self._indekse_ekle(parametre, hatirlatici)
+
+    def _anahtarlar(self, parametre, hatirlatici):
+        return {
+            "parametre": parametre,
+            "tip": hatirlatici["tip"],
+            "aktif": bool(hatirlatici["aktif"]),
+            "tekrar": hatirlatici.get("tekrar", "Bir Kez"),
+        }
+
+    def _indekse_ekle(self, parametre, hatirlatici):
+        hatirlatici_id = hatirlatici["id"]
+        self.kurallar[hatirlatici_id] = (parametre, hatirlatici)
+        for alan, anahtar in self._anahtarlar(parametre, hatirlatici).items():
+            self.indeks[alan][anahtar].add(hatirlatici_id)
+        bisect.insort(self.degerler, (hatirlatici["deger"], hatirlatici_id))
+
+    def _indeksten_cikar(self, hatirlatici_id):
+        parametre, hatirlatici = self.kurallar.pop(hatirlatici_id)
+        for alan, anahtar in self._anahtarlar(parametre, hatirlatici).items():
+            self.indeks[alan][anahtar].discard(hatirlatici_id)
+        konum = bisect.bisect_left(self.degerler, (hatirlatici["deger"], hatirlatici_id))
+        del self.degerler[konum]
+        return parametre, hatirlatici
+
+    def __len__(self):
+        return len(self.kurallar)
+
+    def getir(self, hatirlatici_id):
+        return self.kurallar.get(hatirlatici_id, (None, None))
+
+    def ekle(self, parametre, hatirlatici):
+        self.ayarlar["hatirlatici_son_id"] = self.ayarlar.get("hatirlatici_son_id", 0) + 1
+        hatirlatici["id"] = self.ayarlar["hatirlatici_son_id"]
+        self.ayarlar["hatirlaticilar"].setdefault(parametre, []).append(hatirlatici)
+        self._indekse_ekle(parametre, hatirlatici)
+        return hatirlatici["id"]
+
+    def guncelle(self, hatirlatici_id, parametre, hatirlatici):
+        eski_parametre, eski_hatirlatici = self._indeksten_cikar(hatirlatici_id)
+        hatirlatici["id"] = hatirlatici_id
+        liste = self.ayarlar["hatirlaticilar"][eski_parametre]
+        if eski_parametre == parametre:
+            liste[liste.index(eski_hatirlatici)] = hatirlatici
+        else:
+            liste.remove(eski_hatirlatici)
+            self.ayarlar["hatirlaticilar"].setdefault(parametre, []).append(hatirlatici)
+        self._indekse_ekle(parametre, hatirlatici)
+
+    def sil(self, hatirlatici_id):
+        parametre, hatirlatici = self._indeksten_cikar(hatirlatici_id)
+        self.ayarlar["hatirlaticilar"][parametre].remove(hatirlatici)
+
+    def ara(self, parametre=None, tip=None, aktif=None, tekrar=None, min_deger=None, max_deger=None, min_dahil=True, max_dahil=True):
+        kumeler = []
+        for alan, anahtar in (("parametre", parametre), ("tip", tip), ("aktif", aktif), ("tekrar", tekrar)):
+            if anahtar is not None:
+                kumeler.append(self.indeks[alan].get(anahtar, set()))
+
+        if min_deger is not None or max_deger is not None:
+            # Sınır dahil değilse eşit değerler dilimin dışında bırakılır
+            if min_deger is None:
+                baslangic = 0
+            elif min_dahil:
+                baslangic = bisect.bisect_left(self.degerler, (min_deger, float("-inf")))
+            else:
+                baslangic = bisect.bisect_right(self.degerler, (min_deger, float("inf")))
+            if max_deger is None:
+                bitis = len(self.degerler)
+            elif max_dahil:
+                bitis = bisect.bisect_right(self.degerler, (max_deger, float("inf")))
+            else:
+                bitis = bisect.bisect_left(self.degerler, (max_deger, float("-inf")))
+            kumeler.append({hatirlatici_id for _, hatirlatici_id in self.degerler[baslangic:bitis]})
+
+        if not kumeler:
+            return sorted(self.kurallar)
+        kumeler.sort(key=len)
+        sonuc = set(kumeler[0])
+        for kume in kumeler[1:]:
+            sonuc &= kume
+        return sorted(sonuc)
+
+    def eslesir_mi(self, hatirlatici_id, parametre=None, tip=None, aktif=None, tekrar=None, min_deger=None, max_deger=None, min_dahil=True, max_dahil=True):
+        kural_parametre, hatirlatici = self.getir(hatirlatici_id)
+        if hatirlatici is None:
+            return False
+        anahtarlar = self._anahtarlar(kural_parametre, hatirlatici)
+        for alan, anahtar in (("parametre", parametre), ("tip", tip), ("aktif", aktif), ("tekrar", tekrar)):
+            if anahtar is not None and anahtarlar[alan] != anahtar:
+                return False
+        deger = hatirlatici["deger"]
+        if min_deger is not None and (deger < min_deger if min_dahil else deger <= min_deger):
+            return False
+        if max_deger is not None and (deger > max_deger if max_dahil else deger >= max_deger):
+            return False
+        return True
+
+
+class KayanPencere:
+    # Zaman tabanlı kayan pencere. Ortalama için artımlı toplam, maks/min için monoton deque
+    # tutulur; her gözlem amortize O(1) maliyetle eklenir ve geçmiş yeniden taranmaz.
+    def __init__(self, sure, durum=None):
+        self.sure = sure
+        durum = durum or {}
+        self.ogeler = deque(tuple(oge) for oge in durum.get("ogeler", []))
+        self.maks = deque(tuple(oge) for oge in durum.get("maks", []))
+        self.min = deque(tuple(oge) for oge in durum.get("min", []))
+        self.toplam = sum(deger for _, deger in self.ogeler)
+
+    def ekle(self, zaman, deger):
+        self.ogeler.append((zaman, deger))
+        self.toplam += deger
+        while self.maks and self.maks[-1][1] <= deger:
+            self.maks.pop()
+        self.maks.append((zaman, deger))
+        while self.min and self.min[-1][1] >= deger:
+            self.min.pop()
+        self.min.append((zaman, deger))
+        self.eskileri_at(zaman)
+
+    def eskileri_at(self, simdi):
+        sinir = simdi - self.sure
+        while self.ogeler and self.ogeler[0][0] <= sinir:
+            self.toplam -= self.ogeler.popleft()[1]
+        while self.maks and self.maks[0][0] <= sinir:
+            self.maks.popleft()
+        while self.min and self.min[0][0] <= sinir:
+            self.min.popleft()
+
+    def ortalama(self):
+        return self.toplam / len(self.ogeler) if self.ogeler else None
+
+    def en_buyuk(self):
+        return self.maks[0][1] if self.maks else None
+
+    def en_kucuk(self):
+        return self.min[0][1] if self.min else None
+
+    def durum(self):
+        return {"ogeler": list(self.ogeler), "maks": list(self.maks), "min": list(self.min)}
+
+
+class TarimsalToplamlar:
+    # Ana konumun gözlem akışından son işlemden beri GDD ve yağış toplamlarını,
+    # son 24 saatin sıcaklık/nem/rüzgar istatistiklerini artımlı olarak tutar.
+    def __init__(self, durum=None):
+        durum = durum or {}
+        self.son_zaman = durum.get("son_zaman")
+        self.son_yagis = durum.get("son_yagis")
+        self.islemler = {
+            islem: dict(durum.get("islemler", {}).get(islem, {"gdd": 0.0, "yagis": 0.0}))
+            for islem in ("gubreleme", "ilaclama")
+        }
+        self.pencereler = {
+            parametre: KayanPencere(KAYAN_PENCERE_SURESI, durum.get("pencereler", {}).get(parametre))
+            for parametre in ("Sıcaklık", "Nem", "Rüzgar Hızı")
+        }
+
+    def gozlem_ekle(self, zaman, hava_durumu):
+        sicaklik = sayisal_deger(hava_durumu.get("Sıcaklık"))
+        yagis = sayisal_deger(hava_durumu.get("Yağmur"))
+
+        if self.son_zaman is not None and sicaklik is not None:
+            aralik = min(max(0.0, zaman - self.son_zaman), MAKS_GOZLEM_ARALIGI)
+            gdd = max(0.0, sicaklik - GDD_TABAN_SICAKLIK) * aralik / 86400
+            for toplam in self.islemler.values():
+                toplam["gdd"] += gdd
+
+        if yagis is not None:
+            # MGM yağışı birikimli gösterdiği için sadece artış eklenir; değer düşmüşse sayaç sıfırlanmıştır
+            if self.son_yagis is not None:
+                artis = yagis if yagis < self.son_yagis else yagis - self.son_yagis
+                for toplam in self.islemler.values():
+                    toplam["yagis"] += artis
+            self.son_yagis = yagis
+
+        for parametre, pencere in self.pencereler.items():
+            deger = sayisal_deger(hava_durumu.get(parametre))
+            if deger is not None:
+                pencere.ekle(zaman, deger)
+
+        self.son_zaman = zaman
+
+    def islem_sifirla(self, islem):
+        self.islemler[islem] = {"gdd": 0.0, "yagis": 0.0}
+
+    def degerler(self, simdi=None):
+        # Okumadan önce pencereler verilen ana göre budanır; gözlem gelmese de eski değerler dönmez
+        simdi = time.time() if simdi is None else simdi
+        for pencere in self.pencereler.values():
+            pencere.eskileri_at(simdi)
+        sicaklik, nem, ruzgar = self.pencereler["Sıcaklık"], self.pencereler["Nem"], self.pencereler["Rüzgar Hızı"]
+        degerler = {
+            "GDD (Gübreleme)": self.islemler["gubreleme"]["gdd"],
+            "Yağış (Gübreleme)": self.islemler["gubreleme"]["yagis"],
+            "GDD (İlaçlama)": self.islemler["ilaclama"]["gdd"],
+            "Yağış (İlaçlama)": self.islemler["ilaclama"]["yagis"],
+            "Sıcaklık Min (24s)": sicaklik.en_kucuk(),
+            "Sıcaklık Maks (24s)": sicaklik.en_buyuk(),
+            "Nem Ort (24s)": nem.ortalama(),
+            "Nem Min (24s)": nem.en_kucuk(),
+            "Nem Maks (24s)": nem.en_buyuk(),
+            "Rüzgar Ort (24s)": ruzgar.ortalama(),
+            "Rüzgar Maks (24s)": ruzgar.en_buyuk(),
+        }
+        return {parametre: round(deger, 2) for parametre, deger in degerler.items() if deger is not None}
+
+    def durum(self):
+        return {
+            "son_zaman": self.son_zaman,
+            "son_yagis": self.son_yagis,
+            "islemler": self.islemler,
+            "pencereler": {parametre: pencere.durum() for parametre, pencere in self.pencereler.items()},
+        }
+
+
+def tahmin_izgarasi(tahminler, anahtarlar, baslangic, adim=TAHMIN_ADIMI, uzunluk=TAHMIN_UZUNLUGU):
+    # Konumların tahminlerini ortak bir zaman eksenine (konum x adım) yerleştirir; eksik değerler nan kalır
+    zamanlar = baslangic + adim * np.arange(uzunluk)
+    sicaklik = np.full((len(anahtarlar), uzunluk), np.nan)
+    ruzgar = np.full_like(sicaklik, np.nan)
+    yagis = np.full_like(sicaklik, np.nan)
+
+    for satir, anahtar in enumerate(anahtarlar):
+        tahmin = tahminler.get(anahtar)
+        if not tahmin:
+            continue
+        sutunlar = np.rint((np.asarray(tahmin["zaman"], dtype=float) - baslangic) / adim).astype(int)
+        gecerli = (sutunlar >= 0) & (sutunlar < uzunluk)
+        sicaklik[satir, sutunlar[gecerli]] = np.asarray(tahmin["sicaklik"], dtype=float)[gecerli]
+        ruzgar[satir, sutunlar[gecerli]] = np.asarray(tahmin["ruzgar"], dtype=float)[gecerli]
+        yagis[satir, sutunlar[gecerli]] = np.asarray(tahmin["yagis"], dtype=float)[gecerli]
+    return zamanlar, sicaklik, ruzgar, yagis
+
+
+def pencere_planla(zamanlar, sicaklik, ruzgar, yagis, konum_indeksleri, en_erken, kural, adim=TAHMIN_ADIMI):
+    # Tüm parseller için tek geçişte en erken uygun pencerenin zaman indeksini döndürür (yoksa -1).
+    # Bir adım uygunsa: rüzgar ve sıcaklık sınırlar içinde, ve o adımdan itibaren
+    # kural["yagissiz_saat"] boyunca yağış yok. Bilinmeyen (nan) tahminler uygun sayılmaz.
+    with np.errstate(invalid="ignore"):
+        uygun = (ruzgar <= kural["maks_ruzgar"]) & (sicaklik >= kural["min_sicaklik"]) & (sicaklik <= kural["maks_sicaklik"])
+
+    adim_sayisi = max(1, int(np.ceil(kural["yagissiz_saat"] * 3600 / adim)))
+    yagisli = np.where(np.isnan(yagis), 1, yagis > 0).astype(np.int32)
+    kumulatif = np.concatenate([np.zeros((yagisli.shape[0], 1), dtype=np.int32), np.cumsum(yagisli, axis=1)], axis=1)
+    yagissiz = np.zeros_like(uygun)
+    son = yagisli.shape[1] - adim_sayisi + 1
+    if son > 0:
+        yagissiz[:, :son] = (kumulatif[:, adim_sayisi:] - kumulatif[:, :son]) == 0
+    uygun &= yagissiz
+
+    parsel_uygun = uygun[konum_indeksleri] & (zamanlar[None, :] >= en_erken[:, None])
+    secilen = parsel_uygun.argmax(axis=1)
+    secilen[~parsel_uygun.any(axis=1)] = -1
+    return secilen
+
+
+def hatirlatici_mesaji(parametre, parametre_deger, hatirlatici, hava_durumu):
+    gosterilen = hava_durumu.get(parametre, parametre_deger)
+    if hatirlatici["tip"] == "altinda" and parametre_deger < hatirlatici["deger"]:
+        return f"{parametre} değeri {hatirlatici['deger']} değerinin altında! (Şu anki {parametre}: {gosterilen})"
+    elif hatirlatici["tip"] == "ustunde" and parametre_deger > hatirlatici["deger"]:
+        return f"{parametre} değeri {hatirlatici['deger']} değerinin üstünde! (Şu anki {parametre}: {gosterilen})"
+    elif hatirlatici["tip"] == "esit" and parametre_deger == hatirlatici["deger"]:
+        return f"{parametre} değeri {hatirlatici['deger']} değerine eşit! (Şu anki {parametre}: {gosterilen})"
+    return None
+
+
+def tekrarlanan_hatirlatici_mesaji(parametre, parametre_deger, hatirlatici, hava_durumu, bugun):
+    if hatirlatici["tekrar"] == "Günlük":
+        return hatirlatici_mesaji(parametre, parametre_deger, hatirlatici, hava_durumu)
+    elif hatirlatici["tekrar"] == "Haftalık":
+        if bugun.weekday() == 0:  # Pazartesi ise (0: Pazartesi, 6: Pazar)
+            return hatirlatici_mesaji(parametre, parametre_deger, hatirlatici, hava_durumu)
+    elif hatirlatici["tekrar"] == "Aylık":
+        if bugun.day == 1:  # Ayın 1'i ise
+            return hatirlatici_mesaji(parametre, parametre_deger, hatirlatici, hava_durumu)
+    return None
+
+
+def parametre_degeri(parametre, hava_durumu, toplam_degerleri):
+    if parametre in TARIMSAL_PARAMETRELER:
+        return toplam_degerleri[parametre]
+    elif parametre in METIN_PARAMETRELERI:
+        return hava_durumu[parametre]
+    else:
+        deger = sayisal_deger(hava_durumu[parametre])
+        if deger is None:
+            raise ValueError(f"{parametre} için sayısal değer yok: {hava_durumu[parametre]}")
+        return deger
+
+
+def hatirlaticilari_degerlendir(hatirlaticilar, hava_durumu, toplam_degerleri, bugun):
+    # Canlı kontrolün ve tekrar oynatmanın ortak yolu: tetiklenen her kural için
+    # (parametre, hatirlatici, uyari_mesaji) üretir. bugun, tekrarlama günlerinin saatidir.
+    for parametre, parametre_hatirlaticilari in hatirlaticilar.items():
+        if parametre not in hava_durumu and parametre not in toplam_degerleri:
+            continue
+
+        try:
+            parametre_deger = parametre_degeri(parametre, hava_durumu, toplam_degerleri)
+
+            # Tetiklenen kurallar silinebildiği için listenin kopyası üzerinde dönülür
+            for hatirlatici in list(parametre_hatirlaticilari):
+                if not hatirlatici["aktif"]:
+                    continue
+
+                if hatirlatici.get("tekrar") == "Bir Kez":
+                    uyari_mesaji = hatirlatici_mesaji(parametre, parametre_deger, hatirlatici, hava_durumu)
+                else:
+                    uyari_mesaji = tekrarlanan_hatirlatici_mesaji(parametre, parametre_deger, hatirlatici, hava_durumu, bugun)
+
+                if uyari_mesaji:
+                    yield parametre, hatirlatici, uyari_mesaji
+
+        except (ValueError, TypeError) as e:
+            logging.error(f"Hata: {parametre} için hatırlatıcı kontrolünde hata: {e}")
+            continue
+        except KeyError as e:
+            logging.error(f"Hava durumu verisinde eksik anahtar: {e}")
+            continue
+
+
+def kayitlari_oku(dosya_yolu, il=None, ilce=None, baslangic=None, bitis=None, gerekli_alanlar=()):
+    # JSON Lines geçmişini satır satır okur; dosyanın tamamı belleğe alınmaz.
+    # "zaman" alanı datetime'a çevrilir, tarih aralığı (baslangic/bitis dahil) gün bazındadır.
+    # Konum büyük/küçük harf ve Türkçe karakter farkı gözetmeden eşleşir; zaman/il/ilce ya da
+    # gerekli_alanlar'dan biri eksik olan kayıtlar uyarıyla atlanır.
+    il = turkce_normalize(il) if il else None
+    ilce = turkce_normalize(ilce) if ilce else None
+    with open(dosya_yolu, "r", encoding="utf-8") as file:
+        for satir_no, satir in enumerate(file, 1):
+            if not satir.strip():
+                continue
+            try:
+                kayit = json.loads(satir)
+                if not isinstance(kayit, dict):
+                    raise ValueError("kayıt bir nesne değil")
+                for alan in ("zaman", "il", "ilce") + tuple(gerekli_alanlar):
+                    if alan not in kayit:
+                        raise KeyError(alan)
+                if not isinstance(kayit.get("hava_durumu", {}), dict):
+                    raise ValueError("hava_durumu bir nesne değil")
+                if (il and turkce_normalize(kayit["il"]) != il) or (ilce and turkce_normalize(kayit["ilce"]) != ilce):
+                    continue
+                kayit["zaman"] = datetime.fromisoformat(kayit["zaman"])
+                if (baslangic and kayit["zaman"].date() < baslangic) or (bitis and kayit["zaman"].date() > bitis):
+                    continue
+                yield kayit
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                logging.warning(f"{dosya_yolu}:{satir_no} atlandı: {e}")
+
+
+def gozlemleri_oku(dosya_yolu, il=None, ilce=None):
+    for kayit in kayitlari_oku(dosya_yolu, il, ilce, gerekli_alanlar=("hava_durumu",)):
+        yield kayit["zaman"], kayit["hava_durumu"]
+
+
+def islemleri_oku(dosya_yolu, il=None, ilce=None):
+    # Henüz işlem kaydı yoksa boş seri döner
+    if not os.path.exists(dosya_yolu):
+        return
+    for kayit in kayitlari_oku(dosya_yolu, il, ilce, gerekli_alanlar=("islem",)):
+        if kayit["islem"] in ("gubreleme", "ilaclama"):
+            yield kayit["zaman"], kayit["islem"]
+
+
+def gecmisi_disa_aktar(hedef, veri="gozlem", bicim="csv", il=None, ilce=None, baslangic=None, bitis=None, parca_boyutu=DISA_AKTARMA_PARCA_BOYUTU):
+    # Gözlem veya işlem geçmişini parça parça CSV/Parquet'e yazar; bellekte en fazla
+    # parca_boyutu satır tutulur. Yazılan satır sayısını döndürür.
+    if veri == "gozlem":
+        kaynak = GOZLEM_GECMISI_FILE
+        gerekli_alanlar = ("hava_durumu",)
+        sutunlar = ["zaman", "il", "ilce"] + list(DISA_AKTARMA_GOZLEM_SUTUNLARI.values())
+
+        def satir(kayit):
+            sonuc = {"zaman": kayit["zaman"], "il": kayit["il"], "ilce": kayit["ilce"]}
+            for parametre, sutun in DISA_AKTARMA_GOZLEM_SUTUNLARI.items():
+                deger = kayit["hava_durumu"].get(parametre)
+                sonuc[sutun] = deger if parametre in METIN_PARAMETRELERI else sayisal_deger(deger)
+            return sonuc
+    else:
+        kaynak = ISLEM_GECMISI_FILE
+        gerekli_alanlar = ("islem",)
+        sutunlar = ["zaman", "il", "ilce", "islem"]
+
+        def satir(kayit):
+            return {sutun: kayit.get(sutun) for sutun in sutunlar}
+
+    if not os.path.exists(kaynak):
+        raise FileNotFoundError(f"{kaynak} bulunamadı, henüz kayıt yok.")
+
+    if bicim == "parquet":
+        if pq is None:
+            raise RuntimeError("Parquet için pyarrow kurulu olmalı (pip install pyarrow).")
+        metin_sutunlari = {"il", "ilce", "islem"} | {DISA_AKTARMA_GOZLEM_SUTUNLARI[parametre] for parametre in METIN_PARAMETRELERI}
+        alanlar = []
+        for sutun in sutunlar:
+            if sutun == "zaman":
+                alanlar.append((sutun, pa.timestamp("s")))
+            elif sutun in metin_sutunlari:
+                alanlar.append((sutun, pa.string()))
+            else:
+                alanlar.append((sutun, pa.float64()))
+        sema = pa.schema(alanlar)
+        yazici = pq.ParquetWriter(hedef, sema)
+        yaz = lambda parca: yazici.write_table(pa.Table.from_pylist(parca, schema=sema))
+        kapat = yazici.close
+    else:
+        file = open(hedef, "w", newline="", encoding="utf-8-sig")  # BOM: Excel Türkçe karakterleri doğru açsın
+        yazici = csv.DictWriter(file, fieldnames=sutunlar)
+        yazici.writeheader()
+        yaz = yazici.writerows
+        kapat = file.close
+
+    adet = 0
+    try:
+        parca = []
+        for kayit in kayitlari_oku(kaynak, il, ilce, baslangic, bitis, gerekli_alanlar):
+            parca.append(satir(kayit))
+            if len(parca) >= parca_boyutu:
+                yaz(parca)
+                adet += len(parca)
+                parca = []
+        if parca:
+            yaz(parca)
+            adet += len(parca)
+    finally:
+        kapat()
+    return adet
+
+
+def sentetik_gozlemler(baslangic, gun=30, adim_dakika=10, tohum=0):
+    # Günlük sıcaklık/nem döngüsü, rastgele yürüyen rüzgar ve gece yarısı sıfırlanan birikimli yağış
+    rastgele = random.Random(tohum)
+    ruzgar = 10.0
+    yagis = 0.0
+    adim = timedelta(minutes=adim_dakika)
+    zaman = baslangic
+    for _ in range(int(gun * 24 * 60 / adim_dakika)):
+        saat = zaman.hour + zaman.minute / 60
+        sicaklik = 15 + 8 * math.sin((saat - 9) / 24 * 2 * math.pi) + rastgele.gauss(0, 1)
+        nem = min(100.0, max(10.0, 70 - 2 * (sicaklik - 15) + rastgele.gauss(0, 5)))
+        ruzgar = min(60.0, max(0.0, ruzgar + rastgele.gauss(0, 1.5)))
+        if zaman.hour == 0 and zaman.minute < adim_dakika:
+            yagis = 0.0
+        if rastgele.random() < 0.02:
+            yagis += round(rastgele.uniform(0.2, 4.0), 1)
+        yield zaman, {
+            "Sıcaklık": f"{sicaklik:.1f}°C",
+            "Hava Durumu": "Yağmurlu" if yagis else "Açık",
+            "Yağmur": f"{yagis:.1f} mm",
+            "Nem": f"{nem:.0f} %",
+            "Rüzgar Hızı": f"{ruzgar:.0f} km/sa",
+        }
+        zaman += adim
+
+
+class TekrarOynatici:
+    # Bir gözlem serisini canlı kontrolle aynı değerlendirme yolundan, gözlem zamanlarını
+    # simüle saat olarak kullanıp beklemeden geçirir. Kurallar kopyalanır; kayıtlı veriler değişmez.
+    # Tetiklenen "Bir Kez" kurallar canlıdaki gibi silinir, diğerleri kalır. Kayıtlı gübreleme/ilaçlama
+    # işlemleri verilirse GDD/yağış toplamları canlıdaki gibi işlem anlarında sıfırlanır.
+    def __init__(self, hatirlaticilar):
+        self.hatirlaticilar = copy.deepcopy(hatirlaticilar)
+        self.kurallar = {
+            hatirlatici["id"]: f"{parametre} {hatirlatici['tip']} {hatirlatici['deger']} ({hatirlatici.get('tekrar', 'Bir Kez')})"
+            for parametre, liste in self.hatirlaticilar.items() for hatirlatici in liste
+        }
+        self.toplamlar = TarimsalToplamlar()
+
+    def oynat(self, gozlemler, islemler=()):
+        zaman_cizelgesi = defaultdict(list)
+        adet = 0
+        islem_adet = 0
+        islemler = iter(islemler)  # Zamana göre sıralı (zaman, islem) çiftleri
+        siradaki_islem = next(islemler, None)
+        baslangic = time.perf_counter()
+        for zaman, hava_durumu in gozlemler:
+            adet += 1
+            while siradaki_islem is not None and siradaki_islem[0] <= zaman:
+                self.toplamlar.islem_sifirla(siradaki_islem[1])
+                islem_adet += 1
+                siradaki_islem = next(islemler, None)
+            self.toplamlar.gozlem_ekle(zaman.timestamp(), hava_durumu)
+            tetiklenenler = hatirlaticilari_degerlendir(self.hatirlaticilar, hava_durumu, self.toplamlar.degerler(zaman.timestamp()), zaman)
+            for parametre, hatirlatici, _ in tetiklenenler:
+                zaman_cizelgesi[hatirlatici["id"]].append(zaman.isoformat(timespec="minutes"))
+                if hatirlatici.get("tekrar") == "Bir Kez":
+                    self.hatirlaticilar[parametre].remove(hatirlatici)
+        sure = time.perf_counter() - baslangic
+
+        return {
+            "gozlem_sayisi": adet,
+            "islem_sayisi": islem_adet,
+            "sure": sure,
+            "gozlem_per_saniye": adet / sure if sure > 0 else float("inf"),
+            "tetiklenme_sayisi": sum(len(zamanlar) for zamanlar in zaman_cizelgesi.values()),
+            "kurallar": {
+                hatirlatici_id: {"kural": kural, "tetiklenme": len(zaman_cizelgesi[hatirlatici_id]), "zamanlar": zaman_cizelgesi[hatirlatici_id]}
+                for hatirlatici_id, kural in self.kurallar.items()
+            },
+        }
+
+
+def tekrar_oynatma_raporu(sonuc, zaman_limiti=5, kural_limiti=None):
+    # kural_limiti verilirse en çok tetiklenen kurallar listelenir, kalanlar tek satırda özetlenir
+    satirlar = [
+        f"{sonuc['gozlem_sayisi']} gözlem {sonuc['sure']:.3f} sn'de oynatıldı ({sonuc['gozlem_per_saniye']:.0f} gözlem/sn).",
+        f"Toplam tetiklenme: {sonuc['tetiklenme_sayisi']}",
+    ]
+    if sonuc.get("islem_sayisi"):
+        satirlar.append(f"GDD/yağış toplamları {sonuc['islem_sayisi']} kayıtlı işlemde sıfırlandı.")
+    else:
+        satirlar.append("Not: İşlem kaydı yok; GDD/yağış toplamları serinin başından itibaren birikti.")
+
+    kurallar = list(sonuc["kurallar"].items())
+    if kural_limiti is not None and len(kurallar) > kural_limiti:
+        kurallar.sort(key=lambda oge: oge[1]["tetiklenme"], reverse=True)
+        kalan = len(kurallar) - kural_limiti
+        kurallar = kurallar[:kural_limiti]
+    else:
+        kalan = 0
+    for hatirlatici_id, kural in kurallar:
+        satir = f"#{hatirlatici_id} {kural['kural']}: {kural['tetiklenme']} kez"
+        if kural["zamanlar"]:
+            ilkler = ", ".join(kural["zamanlar"][:zaman_limiti])
+            satir += f" [{ilkler}{', ...' if len(kural['zamanlar']) > zaman_limiti else ''}]"
+        satirlar.append(satir)
+    if kalan:
+        satirlar.append(f"... ve {kalan} kural daha")
+    return "\n".join(satirlar)
+
+
+def hatirlatici_sorgusu_coz(metin):
+    # "nem üstünde -5..80 aktif günlük" gibi bir arama metnini HatirlaticiDeposu.ara filtrelerine çevirir;
+    # tanınmayan bir kelime varsa hiçbir kural eşleşmesin diye None döner
+    sayi = r"-?\d+(?:[.,]\d+)?"
+    aralik_deseni = re.compile(rf"({sayi})(?:\.\.|-)({sayi})")
+    karsilastirma_deseni = re.compile(rf"([<>]=?|=)({sayi})")
+    parametreler = [(re.findall(r"\w+", turkce_normalize(parametre)), parametre) for parametre in HATIRLATICI_PARAMETRELERI]
+    tipler = {"altinda": "altinda", "ustunde": "ustunde", "esit": "esit"}
+    tekrarlar = {turkce_normalize(tekrar).replace(" ", ""): tekrar for tekrar in HATIRLATICI_TEKRARLARI}
+
+    def sayiya(metin):
+        return float(metin.replace(",", "."))
+
+    def eslesen_kelime_sayisi(kelimeler, parca):
+        # Ardışık arama kelimelerinin, parametre adının ardışık kelimelerinin öneki olduğu en uzun eşleşme
+        en_iyi = 0
+        for baslangic in range(len(parca)):
+            k = 0
+            while k < len(kelimeler) and baslangic + k < len(parca) and parca[baslangic + k].startswith(kelimeler[k]):
+                k += 1
+            en_iyi = max(en_iyi, k)
+        return en_iyi
+
+    def sinirlari_ayarla(alt=None, ust=None, alt_dahil=True, ust_dahil=True):
+        # Yalnızca dahil olmayan sınırlar filtreye yazılır; ara() varsayılan olarak dahil kabul eder
+        for anahtar, deger, dahil in (("min", alt, alt_dahil), ("max", ust, ust_dahil)):
+            if deger is None:
+                continue
+            filtre[f"{anahtar}_deger"] = deger
+            if dahil:
+                filtre.pop(f"{anahtar}_dahil", None)
+            else:
+                filtre[f"{anahtar}_dahil"] = False
+
+    filtre = {}
+    # Sayı/aralık/karşılaştırma ifadeleri olduğu gibi kalır; diğer parçalar parametre adları gibi
+    # kelimelere bölünür ("(24s)" -> "24s")
+    kelimeler = []
+    for parca in turkce_normalize(metin).replace("bir kez", "birkez").split():
+        if aralik_deseni.fullmatch(parca) or karsilastirma_deseni.fullmatch(parca) or re.fullmatch(sayi, parca):
+            kelimeler.append(parca)
+        else:
+            kelimeler.extend(re.findall(r"\w+", parca))
+    i = 0
+    while i < len(kelimeler):
+        kelime = kelimeler[i]
+        i += 1
+        if eslesme := aralik_deseni.fullmatch(kelime):
+            alt, ust = sorted((sayiya(eslesme.group(1)), sayiya(eslesme.group(2))))
+            sinirlari_ayarla(alt, ust)
+        elif eslesme := karsilastirma_deseni.fullmatch(kelime):
+            isaret, deger = eslesme.group(1), sayiya(eslesme.group(2))
+            if isaret == "=":
+                sinirlari_ayarla(deger, deger)
+            elif isaret.startswith(">"):
+                sinirlari_ayarla(alt=deger, alt_dahil=isaret == ">=")
+            else:
+                sinirlari_ayarla(ust=deger, ust_dahil=isaret == "<=")
+        elif re.fullmatch(sayi, kelime):
+            sinirlari_ayarla(sayiya(kelime), sayiya(kelime))
+        elif kelime in ("aktif", "pasif"):
+            filtre["aktif"] = kelime == "aktif"
+        elif kelime in tipler:
+            filtre["tip"] = tipler[kelime]
+        elif kelime in tekrarlar:
+            filtre["tekrar"] = tekrarlar[kelime]
+        else:
+            # Eşitlikte listede önce gelen parametre seçilir ("ruzgar" -> "Rüzgar Hızı")
+            uzunluklar = [eslesen_kelime_sayisi(kelimeler[i - 1:], parca) for parca, _ in parametreler]
+            uzunluk = max(uzunluklar)
+            if uzunluk == 0:
+                return None
+            filtre["parametre"] = parametreler[uzunluklar.index(uzunluk)][1]
+            i += uzunluk - 1
+    return filtre
+
+
+class SanalTablo(ctk.CTkFrame):
+    # Yalnızca görünür satır sayısı kadar hücre oluşturulur. Kaydırmada aynı hücreler
+    # yeniden kullanılır ve bir hücre sadece metni değiştiyse yeniden yapılandırılır.
+    def __init__(self, master, sutunlar, sutun_genislikleri=None, gorunur_satir=PANO_GORUNUR_SATIR, secim_komutu=None):
+        super().__init__(master, fg_color=COLOR_BACKGROUND)
+        self.sutunlar = sutunlar
+        self.gorunur_satir = gorunur_satir
+        self.secim_komutu = secim_komutu
+
+        self.anahtarlar = []  # Satır sırası
+        self.satirlar = {}  # anahtar -> hücre metinleri
+        self.sira = {}  # anahtar -> self.anahtarlar içindeki konum
+        self.baslangic = 0
+        self.secili = None
+
+        self.govde = ctk.CTkFrame(self, fg_color="transparent")
+        self.govde.pack(side="left", fill="both", expand=True)
+        self.kaydirma_cubugu = ctk.CTkScrollbar(self, command=self._kaydir)
+        self.kaydirma_cubugu.pack(side="right", fill="y")
+
+        genislikler = sutun_genislikleri or [0] * len(sutunlar)
+        for j, sutun in enumerate(sutunlar):
+            ctk.CTkLabel(self.govde, text=sutun, width=genislikler[j], font=(FONT_FAMILY, FONT_SIZE_NORMAL, "bold"), text_color=COLOR_TEXT, anchor="w").grid(row=0, column=j, sticky="w", padx=2)
+
+        self.hucreler = []
+        self.hucre_metinleri = []
+        self.satir_secili_mi = []
+        for i in range(gorunur_satir):
+            satir_hucreleri = []
+            for j in range(len(sutunlar)):
+                hucre = ctk.CTkLabel(self.govde, text="", width=genislikler[j], font=(FONT_FAMILY, FONT_SIZE_NORMAL), text_color=COLOR_TEXT, anchor="w", corner_radius=4)
+                hucre.grid(row=i + 1, column=j, sticky="w", padx=2)
+                hucre.bind("<Button-1>", lambda event, i=i: self._satir_tiklandi(i))
+                hucre.bind("<MouseWheel>", self._tekerlek)
+                hucre.bind("<Button-4>", lambda event: self._kaydir("scroll", -1, "units"))
+                hucre.bind("<Button-5>", lambda event: self._kaydir("scroll", 1, "units"))
+                satir_hucreleri.append(hucre)
+            self.hucreler.append(satir_hucreleri)
+            self.hucre_metinleri.append([""] * len(sutunlar))
+            self.satir_secili_mi.append(False)
+
+        self._ciz()
+
+    def veri_ayarla(self, satirlar):
+        self.anahtarlar = [anahtar for anahtar, _ in satirlar]
+        self.satirlar = {anahtar: tuple(degerler) for anahtar, degerler in satirlar}
+        self.sira = {anahtar: i for i, anahtar in enumerate(self.anahtarlar)}
+        if self.secili not in self.satirlar:
+            self.secili = None
+        self._ciz()
+
+    def satir_guncelle(self, anahtar, degerler):
+        degerler = tuple(degerler)
+        if anahtar not in self.satirlar:
+            self.sira[anahtar] = len(self.anahtarlar)
+            self.anahtarlar.append(anahtar)
+        elif self.satirlar[anahtar] == degerler:
+            return
+        self.satirlar[anahtar] = degerler
+        if self._gorunur_mu(anahtar) or len(self.anahtarlar) <= self.gorunur_satir:
+            self._ciz()
+        else:
+            self._kaydirma_cubugunu_guncelle()
+
+    def satir_sil(self, anahtar):
+        if anahtar not in self.satirlar:
+            return
+        konum = self.sira.pop(anahtar)
+        del self.anahtarlar[konum]
+        del self.satirlar[anahtar]
+        for i in range(konum, len(self.anahtarlar)):
+            self.sira[self.anahtarlar[i]] = i
+        if self.secili == anahtar:
+            self.secili = None
+        self._ciz()
+
+    def secimi_kaldir(self):
+        if self.secili is not None:
+            self.secili = None
+            self._ciz()
+
+    def _gorunur_mu(self, anahtar):
+        konum = self.sira.get(anahtar)
+        return konum is not None and self.baslangic <= konum < self.baslangic + self.gorunur_satir
+
+    def _ciz(self):
+        en_fazla = max(0, len(self.anahtarlar) - self.gorunur_satir)
+        self.baslangic = min(max(0, self.baslangic), en_fazla)
+        bos = ("",) * len(self.sutunlar)
+
+        for i in range(self.gorunur_satir):
+            konum = self.baslangic + i
+            anahtar = self.anahtarlar[konum] if konum < len(self.anahtarlar) else None
+            metinler = self.satirlar[anahtar] if anahtar is not None else bos
+            secili = anahtar is not None and anahtar == self.secili
+
+            renk_degisti = secili != self.satir_secili_mi[i]
+            self.satir_secili_mi[i] = secili
+            for j, metin in enumerate(metinler):
+                metin = str(metin)
+                if metin != self.hucre_metinleri[i][j]:
+                    self.hucre_metinleri[i][j] = metin
+                    self.hucreler[i][j].configure(text=metin)
+                if renk_degisti:
+                    self.hucreler[i][j].configure(fg_color=COLOR_SECONDARY if secili else "transparent")
+
+        self._kaydirma_cubugunu_guncelle()
+
+    def _kaydirma_cubugunu_guncelle(self):
+        toplam = len(self.anahtarlar)
+        if toplam <= self.gorunur_satir:
+            self.kaydirma_cubugu.set(0, 1)
+        else:
+            self.kaydirma_cubugu.set(self.baslangic / toplam, (self.baslangic + self.gorunur_satir) / toplam)
+
+    def _kaydir(self, islem, miktar, birim=None):
+        if islem == "moveto":
+            self.baslangic = int(float(miktar) * len(self.anahtarlar))
+        elif islem == "scroll":
+            miktar = float(miktar)
+            adim = self.gorunur_satir if birim == "pages" else 1
+            self.baslangic += (int(miktar) or (1 if miktar > 0 else -1 if miktar < 0 else 0)) * adim
+        self._ciz()
+
+    def _tekerlek(self, event):
+        self._kaydir("scroll", -1 if event.delta > 0 else 1, "units")
+
+    def _satir_tiklandi(self, i):
+        konum = self.baslangic + i
+        if konum >= len(self.anahtarlar):
+            return
+        anahtar = self.anahtarlar[konum]
+        self.secili = None if self.secili == anahtar else anahtar
+        self._ciz()
+        if self.secim_komutu:
+            self.secim_komutu(self.secili)
+
 
 class TarimTakipApp(ThemedTk):
     def __init__(self):
@@ -123,11 +1161,21 @@ class TarimTakipApp(ThemedTk):
         self.gubreleme_data = load_gubreleme_data()
         self.ilaclama_data = load_ilaclama_data()
         self.genel_ayarlar = load_genel_ayarlar()
+        self.toplamlar = TarimsalToplamlar(load_tarimsal_toplamlar())
+        self.toplam_kayit_zamani = time.time()
+        self.konum_indeksi = KonumIndeksi(load_konum_indeksi())
+        self.parseller = load_parseller(self.konum_indeksi)
+        self.tahminler = load_tahminler()
+        self.plan = {}
+        self.planlari_hesapla()
 
         self.stop_thread = threading.Event()
         self.driver = None
         self.last_fetch_time = 0
         self.fetching_weather = False
+        self.konum_sirasi = 0  # Panoda sıradaki çekilecek konum
+        self.pano_guncelleniyor = False
+        self.mgm_merkezleri = {}  # konum anahtarı -> MGM merkez kaydı
 
         self.create_widgets()
         self.guncelle_ve_goster_hava_durumu()
@@ -181,12 +1229,14 @@ class TarimTakipApp(ThemedTk):
         self.il_entry = ctk.CTkEntry(self.location_frame, font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8, border_width=0, width=100)
         self.il_entry.grid(row=0, column=1, padx=5)
         self.il_entry.insert(0, self.genel_ayarlar.get("il", "İstanbul"))
+        self.il_entry.bind("<Tab>", lambda event: self.konum_tamamla(self.il_entry))
 
         self.ilce_label = ctk.CTkLabel(self.location_frame, text="İlçe:", font=(FONT_FAMILY, FONT_SIZE_NORMAL), text_color="white", anchor="w")
         self.ilce_label.grid(row=0, column=2, padx=(5, 0), sticky="w")
         self.ilce_entry = ctk.CTkEntry(self.location_frame, font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8, border_width=0, width=100)
         self.ilce_entry.grid(row=0, column=3, padx=(5, 0))
         self.ilce_entry.insert(0, self.genel_ayarlar.get("ilce", "Kadıköy"))
+        self.ilce_entry.bind("<Tab>", lambda event: self.konum_tamamla(self.ilce_entry, self.il_entry))
 
         self.kaydet_konum_button = ctk.CTkButton(self.location_frame, text="Kaydet", command=self.kaydet_konum,
                                                   font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8,
@@ -224,6 +1274,18 @@ class TarimTakipApp(ThemedTk):
             label_value = ctk.CTkLabel(frame, text="", font=(FONT_FAMILY, FONT_SIZE_NORMAL), text_color=COLOR_TEXT, anchor="w")
             label_value.pack(side="left")
             self.hava_durumu_labels[secenek] = label_value
+        self.hava_durumu_gosterilen = {}  # Etiketlerde en son gösterilen metinler
+
+        self.pano_tablo = SanalTablo(self.tabview.tab("Hava Durumu"), PANO_SUTUNLARI, PANO_SUTUN_GENISLIKLERI)
+        self.pano_tablo.pack(fill="x", padx=10, pady=(5, 0))
+        self.pano_yenile()
+
+        self.pano_buton_frame = ctk.CTkFrame(self.tabview.tab("Hava Durumu"), fg_color="transparent")
+        self.pano_buton_frame.pack(fill="x", padx=10, pady=(5, 0))
+        self.panoya_ekle_button = ctk.CTkButton(self.pano_buton_frame, text="Panoya Ekle", command=self.panoya_ekle, font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8, fg_color=COLOR_SECONDARY, hover_color=COLOR_ACCENT, text_color="white", width=150)
+        self.panoya_ekle_button.pack(side="left")
+        self.panodan_cikar_button = ctk.CTkButton(self.pano_buton_frame, text="Panodan Çıkar", command=self.panodan_cikar, font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8, fg_color=COLOR_SECONDARY, hover_color=COLOR_ACCENT, text_color="white", width=150)
+        self.panodan_cikar_button.pack(side="right")
 
         self.hava_durumu_secenek_combo = ctk.CTkComboBox(self.tabview.tab("Hava Durumu"), values=HAVA_DURUMU_PARAMETRELERI, command=self.on_combobox_select, font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8)
         self.hava_durumu_secenek_combo.pack(fill="x", padx=10, pady=(5, 0))
@@ -236,11 +1298,11 @@ class TarimTakipApp(ThemedTk):
         self.hatirlatici_frame.pack(fill="both", expand=True)
 
         ctk.CTkLabel(self.hatirlatici_frame, text="Hava Olayı:", font=(FONT_FAMILY, FONT_SIZE_NORMAL), text_color=COLOR_TEXT, anchor="w").grid(row=0, column=0, sticky="w", padx=10, pady=(10, 2))
-        self.hatirlatici_parametre_combo = ctk.CTkComboBox(self.hatirlatici_frame, values=HAVA_DURUMU_PARAMETRELERI, command=self.hatirlatici_parametre_secildi, font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8)
+        self.hatirlatici_parametre_combo = ctk.CTkComboBox(self.hatirlatici_frame, values=HATIRLATICI_PARAMETRELERI, font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8)
         self.hatirlatici_parametre_combo.grid(row=0, column=1, sticky="ew", padx=10, pady=(10, 2))
 
         ctk.CTkLabel(self.hatirlatici_frame, text="Tip:", font=(FONT_FAMILY, FONT_SIZE_NORMAL), text_color=COLOR_TEXT, anchor="w").grid(row=1, column=0, sticky="w", padx=10, pady=2)
-        self.hatirlatici_tip_combo = ctk.CTkComboBox(self.hatirlatici_frame, values=["altinda", "ustunde", "esit"], font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8)
+        self.hatirlatici_tip_combo = ctk.CTkComboBox(self.hatirlatici_frame, values=HATIRLATICI_TIPLERI, font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8)
         self.hatirlatici_tip_combo.grid(row=1, column=1, sticky="ew", padx=10, pady=2)
 
         ctk.CTkLabel(self.hatirlatici_frame, text="Değer:", font=(FONT_FAMILY, FONT_SIZE_NORMAL), text_color=COLOR_TEXT, anchor="w").grid(row=2, column=0, sticky="w", padx=10, pady=2)
@@ -248,7 +1310,7 @@ class TarimTakipApp(ThemedTk):
         self.hatirlatici_deger_entry.grid(row=2, column=1, sticky="ew", padx=10, pady=2)
 
         ctk.CTkLabel(self.hatirlatici_frame, text="Tekrarlama:", font=(FONT_FAMILY, FONT_SIZE_NORMAL), text_color=COLOR_TEXT, anchor="w").grid(row=3, column=0, sticky="w", padx=10, pady=2)
-        self.hatirlatici_tekrar_combo = ctk.CTkComboBox(self.hatirlatici_frame, values=["Bir Kez", "Günlük", "Haftalık", "Aylık"], font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8)
+        self.hatirlatici_tekrar_combo = ctk.CTkComboBox(self.hatirlatici_frame, values=HATIRLATICI_TEKRARLARI, font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8)
         self.hatirlatici_tekrar_combo.grid(row=3, column=1, sticky="ew", padx=10, pady=2)
         self.hatirlatici_tekrar_combo.set("Bir Kez")
 
@@ -261,12 +1323,20 @@ class TarimTakipApp(ThemedTk):
         self.hatirlatici_ekle_button = ctk.CTkButton(self.hatirlatici_frame, text="Ekle/Güncelle", command=self.hatirlatici_ekle_guncelle, font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8, fg_color=COLOR_SECONDARY, hover_color=COLOR_ACCENT, text_color="white")
         self.hatirlatici_ekle_button.grid(row=5, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
 
-        self.hatirlatici_listbox = tk.Listbox(self.hatirlatici_frame, height=5, width=30, bg=COLOR_BACKGROUND, fg=COLOR_TEXT, selectbackground=COLOR_SECONDARY, font=(FONT_FAMILY, FONT_SIZE_NORMAL))
-        self.hatirlatici_listbox.grid(row=6, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
-        self.hatirlatici_listbox.bind("<<ListboxSelect>>", self.hatirlatici_secim_degisti)
+        ctk.CTkLabel(self.hatirlatici_frame, text="Ara:", font=(FONT_FAMILY, FONT_SIZE_NORMAL), text_color=COLOR_TEXT, anchor="w").grid(row=6, column=0, sticky="w", padx=10, pady=2)
+        self.hatirlatici_ara_entry = ctk.CTkEntry(self.hatirlatici_frame, placeholder_text="ör. nem ustunde 60-80 aktif", font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8)
+        self.hatirlatici_ara_entry.grid(row=6, column=1, sticky="ew", padx=10, pady=2)
+        self.hatirlatici_ara_entry.bind("<KeyRelease>", self.hatirlatici_ara)
+
+        self.hatirlatici_deposu = HatirlaticiDeposu(self.genel_ayarlar)
+        self.hatirlatici_filtre = {}
+        self.hatirlatici_tablo = SanalTablo(self.hatirlatici_frame, HATIRLATICI_SUTUNLARI, HATIRLATICI_SUTUN_GENISLIKLERI, gorunur_satir=5, secim_komutu=self.hatirlatici_secim_degisti)
+        self.hatirlatici_tablo.grid(row=7, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
 
         self.hatirlatici_sil_button = ctk.CTkButton(self.hatirlatici_frame, text="Sil", command=self.hatirlatici_sil, state=tk.DISABLED, font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8, fg_color=COLOR_SECONDARY, hover_color=COLOR_ACCENT, text_color="white")
-        self.hatirlatici_sil_button.grid(row=7, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
+        self.hatirlatici_sil_button.grid(row=8, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
+
+        self.hatirlatici_ara()
 
 
     def create_actions_tab_content(self):
@@ -324,16 +1394,58 @@ class TarimTakipApp(ThemedTk):
         self.geri_yukle_button = ctk.CTkButton(self.ayarlar_frame, text="Verileri Geri Yükle", command=self.geri_yukle, font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8, fg_color=COLOR_SECONDARY, hover_color=COLOR_ACCENT, text_color="white")
         self.geri_yukle_button.pack(pady=10)
 
+        self.ilce_listesi_button = ctk.CTkButton(self.ayarlar_frame, text="İlçe Listesini Güncelle", command=self.ilce_listesini_guncelle, font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8, fg_color=COLOR_SECONDARY, hover_color=COLOR_ACCENT, text_color="white")
+        self.ilce_listesi_button.pack(pady=10)
 
+        self.tekrar_oynat_button = ctk.CTkButton(self.ayarlar_frame, text="Kayıtlı Gözlemleri Oynat", command=self.tekrar_oynat, font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8, fg_color=COLOR_SECONDARY, hover_color=COLOR_ACCENT, text_color="white")
+        self.tekrar_oynat_button.pack(pady=10)
+
+        self.sentetik_oynat_button = ctk.CTkButton(self.ayarlar_frame, text="Sentetik Seriyle Test Et", command=lambda: self.tekrar_oynat(sentetik=True), font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8, fg_color=COLOR_SECONDARY, hover_color=COLOR_ACCENT, text_color="white")
+        self.sentetik_oynat_button.pack(pady=10)
+
+        self.disa_aktar_frame = ctk.CTkFrame(self.ayarlar_frame, fg_color="transparent")
+        self.disa_aktar_frame.pack(fill="x", padx=10, pady=10)
+        self.disa_aktar_frame.columnconfigure(1, weight=1)
+
+        ctk.CTkLabel(self.disa_aktar_frame, text="Veri:", font=(FONT_FAMILY, FONT_SIZE_NORMAL), text_color=COLOR_TEXT, anchor="w").grid(row=0, column=0, sticky="w", pady=2)
+        self.disa_aktar_veri_combo = ctk.CTkComboBox(self.disa_aktar_frame, values=["Gözlemler", "İşlemler"], font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8)
+        self.disa_aktar_veri_combo.grid(row=0, column=1, sticky="ew", padx=(10, 0), pady=2)
+
+        ctk.CTkLabel(self.disa_aktar_frame, text="Konum:", font=(FONT_FAMILY, FONT_SIZE_NORMAL), text_color=COLOR_TEXT, anchor="w").grid(row=1, column=0, sticky="w", pady=2)
+        self.disa_aktar_konum_combo = ctk.CTkComboBox(self.disa_aktar_frame, values=["Tüm Konumlar"], font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8)
+        self.disa_aktar_konum_combo.grid(row=1, column=1, sticky="ew", padx=(10, 0), pady=2)
+        self.disa_aktar_konumlarini_guncelle()
+
+        ctk.CTkLabel(self.disa_aktar_frame, text="Başlangıç:", font=(FONT_FAMILY, FONT_SIZE_NORMAL), text_color=COLOR_TEXT, anchor="w").grid(row=2, column=0, sticky="w", pady=2)
+        self.disa_aktar_baslangic = DateEntry(self.disa_aktar_frame, date_pattern="y-m-d", locale="tr_TR")
+        self.disa_aktar_baslangic.set_date(date.today() - timedelta(days=365))
+        self.disa_aktar_baslangic.grid(row=2, column=1, sticky="ew", padx=(10, 0), pady=2)
+
+        ctk.CTkLabel(self.disa_aktar_frame, text="Bitiş:", font=(FONT_FAMILY, FONT_SIZE_NORMAL), text_color=COLOR_TEXT, anchor="w").grid(row=3, column=0, sticky="w", pady=2)
+        self.disa_aktar_bitis = DateEntry(self.disa_aktar_frame, date_pattern="y-m-d", locale="tr_TR")
+        self.disa_aktar_bitis.grid(row=3, column=1, sticky="ew", padx=(10, 0), pady=2)
+
+        self.disa_aktar_button = ctk.CTkButton(self.ayarlar_frame, text="Dışa Aktar (CSV/Parquet)", command=self.disa_aktar, font=(FONT_FAMILY, FONT_SIZE_NORMAL), corner_radius=8, fg_color=COLOR_SECONDARY, hover_color=COLOR_ACCENT, text_color="white")
+        self.disa_aktar_button.pack(pady=(0, 10))
 
-    def fetch_weather_data(self):
-        il = self.il_entry.get().strip()
-        ilce = self.ilce_entry.get().strip()
+
+
+    def fetch_weather_data(self, il=None, ilce=None, bildir=True):
+        # bildir=False iken hatalar sadece loglanır (panodaki toplu çekimler için)
+        if il is None or ilce is None:
+            il = self.il_entry.get().strip()
+            ilce = self.ilce_entry.get().strip()
 
         if not il or not ilce:
-            messagebox.showerror("Hata", "Lütfen şehir ve ilçe bilgilerini girin.")
+            if bildir:
+                messagebox.showerror("Hata", "Lütfen şehir ve ilçe bilgilerini girin.")
             return {}
 
+        konum = self.konum_dogrula(il, ilce, bildir)
+        if konum is None:
+            return {}
+        il, ilce = konum
+
         url = f"https://www.mgm.gov.tr/tahmin/il-ve-ilceler.aspx?il={il}&ilce={ilce}"
         logging.info(f"Hava durumu verisi çekiliyor: {url}")
 
@@ -396,16 +1508,19 @@ class TarimTakipApp(ThemedTk):
 
         except (NoSuchElementException, TimeoutException) as e:
             logging.error(f"Hava durumu verileri alınırken element bulunamadı veya zaman aşımı: {e}")
-            messagebox.showerror("Hata", f"Hava durumu verileri alınamadı: {e}\nİnternet bağlantınızı kontrol edin veya daha sonra tekrar deneyin.")
+            if bildir:
+                messagebox.showerror("Hata", f"Hava durumu verileri alınamadı: {e}\nİnternet bağlantınızı kontrol edin veya daha sonra tekrar deneyin.")
             return {}
         except WebDriverException as e:
             logging.error(f"WebDriver hatası: {e}")
-            messagebox.showerror("Hata", f"Web sürücüsü ile ilgili bir hata oluştu: {e}")
+            if bildir:
+                messagebox.showerror("Hata", f"Web sürücüsü ile ilgili bir hata oluştu: {e}")
             self.driver = None
             return {}
         except Exception as e:
             logging.error(f"Bilinmeyen hata: {e}")
-            messagebox.showerror("Hata", f"Bilinmeyen bir hata oluştu: {e}")
+            if bildir:
+                messagebox.showerror("Hata", f"Bilinmeyen bir hata oluştu: {e}")
             return {}
 
 
@@ -416,31 +1531,353 @@ class TarimTakipApp(ThemedTk):
         self.fetching_weather = True
         self.guncelle_button.configure(text="Güncelleniyor...", state="disabled")
 
-        def update_ui():
+        def update_ui(gozlem):
+            # Ayarlar ve toplamlar yalnızca ana iş parçacığında değiştirilip kaydedilir
+            # Çekim sürerken ana konum değiştiyse gözlem toplamlara katılmaz
+            if gozlem and gozlem[0] == (self.genel_ayarlar["il"], self.genel_ayarlar["ilce"]):
+                (il, ilce), zaman, hava_durumu = gozlem
+                self.genel_ayarlar["hava_durumu"] = hava_durumu
+                anahtar = konum_anahtari(il, ilce)
+                if anahtar in self.izlenen_konum_anahtarlari():
+                    self.genel_ayarlar["konum_hava_durumu"][anahtar] = hava_durumu
+                    self.pano_satiri_guncelle(anahtar)
+                save_genel_ayarlar(self.genel_ayarlar)
+                self.toplamlar.gozlem_ekle(zaman, hava_durumu)
+                self.toplamlari_kaydet()
             hava_durumu = self.genel_ayarlar["hava_durumu"]
 
             for parametre in HAVA_DURUMU_PARAMETRELERI:
                 if parametre in self.genel_ayarlar["secilen_hava_durumu"]:
-                    self.hava_durumu_labels[parametre].configure(text=hava_durumu.get(parametre, "Veri Yok"))
+                    metin = hava_durumu.get(parametre, "Veri Yok")
                 else:
-                    self.hava_durumu_labels[parametre].configure(text="")
+                    metin = ""
+                # Sadece değeri değişen etiketler yeniden yapılandırılır
+                if self.hava_durumu_gosterilen.get(parametre) != metin:
+                    self.hava_durumu_gosterilen[parametre] = metin
+                    self.hava_durumu_labels[parametre].configure(text=metin)
 
+            self.kalan_sure_label.configure(text=self.kalan_gun_hesapla())
             self.hava_durumu_kontrol()
             self.fetching_weather = False
             self.guncelle_button.configure(text="Güncelle", state="normal")
 
         def fetch_data_thread():
+            gozlem = None
             current_time = time.time()
             if current_time - self.last_fetch_time >= 60:
-                hava_durumu = self.fetch_weather_data()
+                # Kutulara yazılan değil, kaydedilmiş ana konum çekilir; gözlem ve toplamlar hep aynı istasyona ait olur
+                il, ilce = self.genel_ayarlar["il"], self.genel_ayarlar["ilce"]
+                hava_durumu = self.fetch_weather_data(il, ilce)
                 if hava_durumu:
-                    self.genel_ayarlar["hava_durumu"] = hava_durumu
-                    save_genel_ayarlar(self.genel_ayarlar)
+                    gozlem_kaydet(il, ilce, hava_durumu)
+                    gozlem = ((il, ilce), current_time, hava_durumu)
                     self.last_fetch_time = current_time
-            self.after(0, update_ui)
+            # Ana konum beklemeden gösterilir; pano ve tahminler ayrı iş parçacığında yenilenir
+            self.after(0, lambda: update_ui(gozlem))
+            self.after(0, self.pano_ve_tahminleri_guncelle)
 
         threading.Thread(target=fetch_data_thread, daemon=True).start()
 
+    def pano_ve_tahminleri_guncelle(self):
+        if self.pano_guncelleniyor or self.stop_thread.is_set():
+            return
+        self.pano_guncelleniyor = True
+
+        def update_ui(cekilenler, tahmin_degisti):
+            # İş parçacığı sadece çektiklerini döndürür; ayarlara burada, Tk iş parçacığında yazılır
+            izlenenler = self.izlenen_konum_anahtarlari()
+            degisenler = [
+                anahtar for anahtar, hava_durumu in cekilenler.items()
+                if anahtar in izlenenler and self.genel_ayarlar["konum_hava_durumu"].get(anahtar) != hava_durumu
+            ]
+            for anahtar in degisenler:
+                self.genel_ayarlar["konum_hava_durumu"][anahtar] = cekilenler[anahtar]
+                self.pano_satiri_guncelle(anahtar)
+            if degisenler:
+                save_genel_ayarlar(self.genel_ayarlar)
+            if tahmin_degisti:
+                self.planlari_hesapla()
+                self.update_calendar_markings()
+            self.pano_guncelleniyor = False
+
+        def pano_thread():
+            cekilenler = self.izlenen_konumlari_cek()
+            tahmin_degisti = self.tahminleri_guncelle()
+            self.after(0, lambda: update_ui(cekilenler, tahmin_degisti))
+
+        threading.Thread(target=pano_thread, daemon=True).start()
+
+
+    def konum_indeksini_doldur(self):
+        # İsteğe bağlı yenileme: tüm illerin ilçe listesini MGM'den çeker ve KONUM_INDEKSI_FILE'a yazar
+        yenilenen = load_data(KONUM_INDEKSI_FILE, {})
+        hatali = []
+        for il in IL_LISTESI:
+            if self.stop_thread.is_set():
+                break
+            try:
+                merkezler = self.mgm_servisi("merkezler/ililcesi", il=il)
+                ilce_listesi = sorted({merkez["ilce"] for merkez in merkezler if merkez.get("ilce")})
+            except (requests.RequestException, ValueError, KeyError, TypeError) as e:
+                logging.error(f"{il} ilçe listesi alınamadı: {e}")
+                hatali.append(il)
+                continue
+            if ilce_listesi:
+                yenilenen[il] = ilce_listesi
+                self.konum_indeksi.ilceleri_ekle(il, ilce_listesi)
+        save_konum_indeksi(yenilenen)
+        return hatali
+
+    def ilce_listesini_guncelle(self):
+        self.ilce_listesi_button.configure(text="Güncelleniyor...", state="disabled")
+
+        def bitti(hatali):
+            self.ilce_listesi_button.configure(text="İlçe Listesini Güncelle", state="normal")
+            if hatali:
+                messagebox.showwarning("Uyarı", f"{len(hatali)} ilin ilçe listesi alınamadı, paketteki liste kullanılmaya devam edecek: {', '.join(hatali)}")
+            else:
+                messagebox.showinfo("Başarılı", "İlçe listesi MGM'den güncellendi.")
+
+        def guncelle_thread():
+            hatali = self.konum_indeksini_doldur()
+            self.after(0, lambda: bitti(hatali))
+
+        threading.Thread(target=guncelle_thread, daemon=True).start()
+
+    def konum_dogrula(self, il, ilce, bildir=True):
+        # Konumu ağ veya tarayıcı işi yapmadan önce indeksle doğrular; kanonik (il, ilce) ya da None döner
+        il_adi, oneriler = self.konum_indeksi.il_coz(il)
+        if il_adi is None:
+            mesaj = f"Bilinmeyen il: {il}."
+        else:
+            ilce_adi, oneriler = self.konum_indeksi.ilce_coz(il_adi, ilce)
+            if ilce_adi is not None:
+                return il_adi, ilce_adi
+            mesaj = f"{il_adi} ilinde bilinmeyen ilçe: {ilce}."
+
+        if oneriler:
+            mesaj += f" Bunu mu demek istediniz: {', '.join(oneriler)}?"
+        logging.warning(mesaj)
+        if bildir:
+            messagebox.showerror("Hata", mesaj)
+        return None
+
+    def konum_tamamla(self, entry, il_entry=None):
+        if il_entry is None:
+            trie = self.konum_indeksi.iller
+        else:
+            il_adi, _ = self.konum_indeksi.il_coz(il_entry.get())
+            trie = self.konum_indeksi.ilceler.get(il_adi)
+
+        metin = entry.get()
+        if trie is None or not metin.strip():
+            return
+        adaylar = trie.tamamla(metin, limit=2)
+        if len(adaylar) == 1:
+            entry.delete(0, tk.END)
+            entry.insert(0, adaylar[0])
+
+    def mgm_servisi(self, yol, **parametreler):
+        yanit = requests.get(f"{MGM_SERVIS_URL}/{yol}", params=parametreler, headers={"Origin": "https://www.mgm.gov.tr"}, timeout=10)
+        yanit.raise_for_status()
+        return yanit.json()
+
+    def mgm_merkezi(self, il, ilce):
+        # Merkez kaydı konum başına bir kez çekilir; sonraki isteklerde önbellekten gelir
+        anahtar = konum_anahtari(il, ilce)
+        if anahtar not in self.mgm_merkezleri:
+            self.mgm_merkezleri[anahtar] = self.mgm_servisi("merkezler", il=il, ilce=ilce)[0]
+        return self.mgm_merkezleri[anahtar]
+
+    def fetch_current_data(self, il, ilce):
+        # Pano için tarayıcısız anlık gözlem; değerler sayfadan okunanlarla aynı biçimdedir
+        try:
+            merkez = self.mgm_merkezi(il, ilce)
+            son_durum = self.mgm_servisi("sondurumlar", merkezid=merkez["merkezId"])[0]
+        except (requests.RequestException, ValueError, KeyError, IndexError, TypeError) as e:
+            logging.error(f"{il}/{ilce} için anlık veri alınamadı: {e}")
+            return {}
+
+        def deger(alan):
+            sayi = son_durum.get(alan)
+            if sayi is None or sayi == -9999:
+                return "Veri Yok"
+            return f"{sayi:g}".replace(".", ",")
+
+        return {
+            "Sıcaklık": f"{deger('sicaklik')}°C",
+            "Yağmur": f"{deger('yagis00Now')} mm",
+            "Nem": f"{deger('nem')} %",
+            "Rüzgar Hızı": f"{deger('ruzgarHiz')} km/sa",
+            "Rakım": f"{merkez.get('yukseklik', 'Veri Yok')} m",
+        }
+
+    def fetch_forecast_data(self, il, ilce):
+        # MGM servisinden 3 saatlik tahminleri çeker; tarayıcı gerektirmez
+        try:
+            istasyon = self.mgm_merkezi(il, ilce)["saatlikTahminIstNo"]
+            tahminler = self.mgm_servisi("tahminler/saatlik", istno=istasyon)
+            tahmin = {"alindi": time.time(), "zaman": [], "sicaklik": [], "ruzgar": [], "yagis": []}
+            for kayit in tahminler[0]["tahmin"]:
+                zaman = datetime.strptime(kayit["tarih"][:19], "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc)
+                tahmin["zaman"].append(zaman.timestamp())
+                tahmin["sicaklik"].append(kayit.get("sicaklik"))
+                tahmin["ruzgar"].append(kayit.get("ruzgarHizi"))
+                tahmin["yagis"].append(1 if kayit.get("hadise") in YAGISLI_HADISELER else 0)
+            return tahmin
+        except (requests.RequestException, ValueError, KeyError, IndexError, TypeError) as e:
+            logging.error(f"{il}/{ilce} için tahmin alınamadı: {e}")
+            return None
+
+    def parsel_listesi(self):
+        ana_parsel = {
+            "ad": ANA_PARSEL_ADI,
+            "il": self.genel_ayarlar["il"],
+            "ilce": self.genel_ayarlar["ilce"],
+            "son_gubreleme": self.gubreleme_data.get("son_gubreleme"),
+            "gubre_araligi": self.gubreleme_data.get("gubre_araligi", 30),
+            "son_ilaclama": self.ilaclama_data.get("son_ilaclama"),
+            "ilac_araligi": self.ilaclama_data.get("ilac_araligi", 15),
+        }
+        return [ana_parsel] + self.parseller
+
+    def tahminleri_guncelle(self):
+        # Parsellerin bulunduğu konumlardan tahmini eskimiş olanları yeniler; artık parsel
+        # bulunmayan konumların tahminleri önbellekten atılır
+        simdi = time.time()
+        anahtarlar = []
+        for parsel in self.parsel_listesi():
+            anahtar = konum_anahtari(parsel["il"], parsel["ilce"])
+            if anahtar not in anahtarlar:
+                anahtarlar.append(anahtar)
+        tahminler = {anahtar: self.tahminler[anahtar] for anahtar in anahtarlar if anahtar in self.tahminler}
+        degisti = len(tahminler) != len(self.tahminler)
+        eskiler = [
+            anahtar for anahtar in anahtarlar
+            if anahtar not in tahminler or simdi - tahminler[anahtar]["alindi"] >= TAHMIN_GUNCELLEME_ARALIGI
+        ]
+
+        for anahtar in eskiler[:TAHMIN_PARTISI]:
+            if self.stop_thread.is_set():
+                break
+            konum = self.konum_dogrula(*anahtar.split("/", 1), bildir=False)
+            if konum is None:
+                continue
+            tahmin = self.fetch_forecast_data(*konum)
+            if tahmin:
+                tahminler[anahtar] = tahmin
+                degisti = True
+
+        if degisti:
+            # Sözlük bütün olarak değiştirilir; ana iş parçacığı yarım güncellenmiş veri görmez
+            self.tahminler = tahminler
+            save_tahminler(tahminler)
+        return degisti
+
+    def planlari_hesapla(self):
+        parseller = self.parsel_listesi()
+        anahtarlar = sorted({konum_anahtari(parsel["il"], parsel["ilce"]) for parsel in parseller})
+        konum_sirasi = {anahtar: i for i, anahtar in enumerate(anahtarlar)}
+        konum_indeksleri = np.array([konum_sirasi[konum_anahtari(parsel["il"], parsel["ilce"])] for parsel in parseller])
+
+        simdi = time.time()
+        baslangic = simdi - simdi % TAHMIN_ADIMI
+        zamanlar, sicaklik, ruzgar, yagis = tahmin_izgarasi(self.tahminler, anahtarlar, baslangic)
+        utc_farki = datetime.now().astimezone().utcoffset().total_seconds()
+
+        self.plan = {}
+        for islem, son_alani, aralik_alani in (("gubreleme", "son_gubreleme", "gubre_araligi"), ("ilaclama", "son_ilaclama", "ilac_araligi")):
+            try:
+                son = np.array([parsel.get(son_alani) or "NaT" for parsel in parseller], dtype="datetime64[D]")
+                aralik = np.array([parsel.get(aralik_alani, parseller[0][aralik_alani]) for parsel in parseller], dtype="timedelta64[D]")
+            except (ValueError, TypeError) as e:
+                logging.error(f"{PARSELLER_DATA_FILE} içinde geçersiz tarih veya aralık: {e}")
+                continue
+            # Sabit aralığa göre vadesi gelmeden pencere aranmaz; hiç işlem yoksa hemen uygundur
+            vade = (son + aralik).astype("datetime64[s]").astype(np.int64) - utc_farki
+            en_erken = np.where(np.isnat(son), simdi, np.maximum(vade, simdi))
+
+            secilen = pencere_planla(zamanlar, sicaklik, ruzgar, yagis, konum_indeksleri, en_erken, PLANLAMA_KURALLARI[islem])
+            self.plan[islem] = {
+                parseller[i]["ad"]: datetime.fromtimestamp(zamanlar[secilen[i]])
+                for i in np.flatnonzero(secilen >= 0)
+            }
+
+    def izlenen_konum_anahtarlari(self):
+        return [konum_anahtari(konum["il"], konum["ilce"]) for konum in self.genel_ayarlar["izlenen_konumlar"]]
+
+    def izlenen_konumlari_cek(self):
+        # İzlenen konumlar sırayla, her seferinde KONUM_GUNCELLEME_PARTISI kadar MGM servisinden çekilir.
+        # Ayarlara dokunmaz; {konum anahtarı: hava durumu} döndürür
+        konumlar = list(self.genel_ayarlar["izlenen_konumlar"])
+        cekilenler = {}
+        if not konumlar:
+            return cekilenler
+
+        for _ in range(min(KONUM_GUNCELLEME_PARTISI, len(konumlar))):
+            if self.stop_thread.is_set():
+                break
+            self.konum_sirasi %= len(konumlar)
+            konum = konumlar[self.konum_sirasi]
+            self.konum_sirasi += 1
+
+            if self.konum_dogrula(konum["il"], konum["ilce"], bildir=False) is None:
+                continue
+            hava_durumu = self.fetch_current_data(konum["il"], konum["ilce"])
+            if not hava_durumu:
+                continue
+            gozlem_kaydet(konum["il"], konum["ilce"], hava_durumu)
+            cekilenler[konum_anahtari(konum["il"], konum["ilce"])] = hava_durumu
+        return cekilenler
+
+    def pano_satiri(self, anahtar):
+        hava_durumu = self.genel_ayarlar["konum_hava_durumu"].get(anahtar, {})
+        return [anahtar] + [hava_durumu.get(parametre, "...") for parametre in PANO_SUTUNLARI[1:]]
+
+    def pano_satiri_guncelle(self, anahtar):
+        self.pano_tablo.satir_guncelle(anahtar, self.pano_satiri(anahtar))
+
+    def pano_yenile(self):
+        self.pano_tablo.veri_ayarla([(anahtar, self.pano_satiri(anahtar)) for anahtar in self.izlenen_konum_anahtarlari()])
+
+    def panoya_ekle(self):
+        il = self.il_entry.get().strip()
+        ilce = self.ilce_entry.get().strip()
+
+        if not il or not ilce:
+            messagebox.showerror("Hata", "Lütfen hem il hem de ilçe bilgisini girin.")
+            return
+
+        konum = self.konum_dogrula(il, ilce)
+        if konum is None:
+            return
+        il, ilce = konum
+
+        anahtar = konum_anahtari(il, ilce)
+        if anahtar in self.izlenen_konum_anahtarlari():
+            messagebox.showinfo("Bilgi", f"{anahtar} zaten panoda.")
+            return
+
+        self.genel_ayarlar["izlenen_konumlar"].append({"il": il, "ilce": ilce})
+        save_genel_ayarlar(self.genel_ayarlar)
+        self.pano_satiri_guncelle(anahtar)
+        self.disa_aktar_konumlarini_guncelle()
+
+    def panodan_cikar(self):
+        anahtar = self.pano_tablo.secili
+        if anahtar is None:
+            messagebox.showerror("Hata", "Lütfen panodan bir konum seçin.")
+            return
+
+        self.genel_ayarlar["izlenen_konumlar"] = [
+            konum for konum in self.genel_ayarlar["izlenen_konumlar"]
+            if konum_anahtari(konum["il"], konum["ilce"]) != anahtar
+        ]
+        self.genel_ayarlar["konum_hava_durumu"].pop(anahtar, None)
+        save_genel_ayarlar(self.genel_ayarlar)
+        self.pano_tablo.satir_sil(anahtar)
+        self.disa_aktar_konumlarini_guncelle()
+
 
     def on_combobox_select(self, event=None):
         selected_option = self.hava_durumu_secenek_combo.get()
@@ -464,8 +1901,23 @@ class TarimTakipApp(ThemedTk):
             threading.Thread(target=thread_target, daemon=True).start()
 
 
+    def ana_konum_degisti(self, konum):
+        # Toplamlar tek bir istasyonun gözlem akışından hesaplanır; yeni konum sıfırdan başlar
+        logging.info(f"Ana konum {konum_anahtari(*konum)} oldu, tarımsal toplamlar sıfırlanıyor.")
+        self.toplamlar = TarimsalToplamlar()
+        self.toplamlari_kaydet(zorla=True)
+        self.genel_ayarlar["hava_durumu"] = {}
+        self.last_fetch_time = 0
+
+    def toplamlari_kaydet(self, zorla=False):
+        simdi = time.time()
+        if zorla or simdi - self.toplam_kayit_zamani >= TOPLAM_KAYIT_ARALIGI:
+            save_tarimsal_toplamlar(self.toplamlar.durum())
+            self.toplam_kayit_zamani = simdi
+
     def on_closing(self):
         self.stop_thread.set()
+        self.toplamlari_kaydet(zorla=True)
         if self.driver:
             try:
                 self.driver.quit()
@@ -474,14 +1926,29 @@ class TarimTakipApp(ThemedTk):
         self.destroy()
 
     def kaydet_konum(self):
-        self.genel_ayarlar["il"] = self.il_entry.get().strip()
-        self.genel_ayarlar["ilce"] = self.ilce_entry.get().strip()
+        il = self.il_entry.get().strip()
+        ilce = self.ilce_entry.get().strip()
 
-        if not self.genel_ayarlar["il"] or not self.genel_ayarlar["ilce"]:
+        if not il or not ilce:
             messagebox.showerror("Hata", "Lütfen hem il hem de ilçe bilgisini girin.")
             return
 
+        konum = self.konum_dogrula(il, ilce)
+        if konum is None:
+            return
+
+        if konum != (self.genel_ayarlar["il"], self.genel_ayarlar["ilce"]):
+            self.ana_konum_degisti(konum)
+
+        # Girilen adları indeksteki yazımlarıyla değiştir (ör. "kadikoy" -> "Kadıköy")
+        self.genel_ayarlar["il"], self.genel_ayarlar["ilce"] = konum
+        self.il_entry.delete(0, tk.END)
+        self.il_entry.insert(0, self.genel_ayarlar["il"])
+        self.ilce_entry.delete(0, tk.END)
+        self.ilce_entry.insert(0, self.genel_ayarlar["ilce"])
+
         save_genel_ayarlar(self.genel_ayarlar)
+        self.disa_aktar_konumlarini_guncelle()
         messagebox.showinfo("Başarılı", "Konum bilgisi kaydedildi!")
         self.guncelle_ve_goster_hava_durumu()
 
@@ -490,10 +1957,17 @@ class TarimTakipApp(ThemedTk):
         if self.gubreleme_var.get():
             self.gubreleme_data["son_gubreleme"] = datetime.now().strftime("%Y-%m-%d")
             save_gubreleme_data(self.gubreleme_data)
+            self.toplamlar.islem_sifirla("gubreleme")
+            islem_kaydet(self.genel_ayarlar["il"], self.genel_ayarlar["ilce"], "gubreleme")
 
         if self.ilaclama_var.get():
             self.ilaclama_data["son_ilaclama"] = datetime.now().strftime("%Y-%m-%d")
             save_ilaclama_data(self.ilaclama_data)
+            self.toplamlar.islem_sifirla("ilaclama")
+            islem_kaydet(self.genel_ayarlar["il"], self.genel_ayarlar["ilce"], "ilaclama")
+
+        self.toplamlari_kaydet(zorla=True)
+        self.planlari_hesapla()
 
         messagebox.showinfo("Başarılı", "Veriler kaydedildi!")
         self.kalan_sure_label.configure(text=self.kalan_gun_hesapla())
@@ -511,33 +1985,53 @@ class TarimTakipApp(ThemedTk):
             son_tarih = datetime.strptime(son_gubreleme, "%Y-%m-%d")
             kalan_gun = (son_tarih + timedelta(days=self.gubreleme_data["gubre_araligi"])) - datetime.now()
             gubre_text = f"Bir sonraki gübreleme: {max(0, kalan_gun.days)} gün sonra."
+            toplam = self.toplamlar.islemler["gubreleme"]
+            gubre_text += f"\n  Gübrelemeden beri: {toplam['gdd']:.1f} GDD, {toplam['yagis']:.1f} mm yağış"
 
         if son_ilaclama:
             son_tarih = datetime.strptime(son_ilaclama, "%Y-%m-%d")
             kalan_gun = (son_tarih + timedelta(days=self.ilaclama_data["ilac_araligi"])) - datetime.now()
             ilac_text = f"Bir sonraki ilaçlama: {max(0, kalan_gun.days)} gün sonra."
+            toplam = self.toplamlar.islemler["ilaclama"]
+            ilac_text += f"\n  İlaçlamadan beri: {toplam['gdd']:.1f} GDD, {toplam['yagis']:.1f} mm yağış"
+
+        degerler = self.toplamlar.degerler()
+        if "Nem Ort (24s)" in degerler or "Rüzgar Maks (24s)" in degerler:
+            pencere_text = (f"Son 24 saat: Nem ort. %{degerler.get('Nem Ort (24s)', '-')}, "
+                            f"Rüzgar maks. {degerler.get('Rüzgar Maks (24s)', '-')} km/sa")
+            return f"{gubre_text}\n{ilac_text}\n{pencere_text}"
 
         return f"{gubre_text}\n{ilac_text}"
 
-    def hatirlatici_parametre_secildi(self, event=None):
-        parametre = self.hatirlatici_parametre_combo.get()
-        if parametre:
-            self.hatirlatici_listbox_guncelle(parametre)
-            self.hatirlatici_yukle(parametre)
-
-    def hatirlatici_listbox_guncelle(self, parametre):
-        self.hatirlatici_listbox.delete(0, tk.END)
-        for hatirlatici in self.genel_ayarlar["hatirlaticilar"].get(parametre, []):
-            aktif_str = "Aktif" if hatirlatici["aktif"] else "Pasif"
-            tekrar_str = hatirlatici.get("tekrar", "Bir Kez")
-            self.hatirlatici_listbox.insert(tk.END, f"{parametre}: {hatirlatici['tip']} {hatirlatici['deger']} ({aktif_str}) ({tekrar_str})")
-
-    def hatirlatici_yukle(self, parametre):
+    def hatirlatici_satiri(self, hatirlatici_id):
+        parametre, hatirlatici = self.hatirlatici_deposu.getir(hatirlatici_id)
+        aktif_str = "Aktif" if hatirlatici["aktif"] else "Pasif"
+        return [parametre, hatirlatici["tip"], hatirlatici["deger"], aktif_str, hatirlatici.get("tekrar", "Bir Kez")]
+
+    def hatirlatici_ara(self, event=None):
+        self.hatirlatici_filtre = hatirlatici_sorgusu_coz(self.hatirlatici_ara_entry.get())
+        idler = [] if self.hatirlatici_filtre is None else self.hatirlatici_deposu.ara(**self.hatirlatici_filtre)
+        onceki_secim = self.hatirlatici_tablo.secili
+        self.hatirlatici_tablo.veri_ayarla([(hatirlatici_id, self.hatirlatici_satiri(hatirlatici_id)) for hatirlatici_id in idler])
+        # Form yalnızca seçili kural aramayla listeden düştüyse temizlenir; yeni kural için girilenler korunur
+        if onceki_secim is not None and self.hatirlatici_tablo.secili is None:
+            self.hatirlatici_formu_temizle()
+
+    def hatirlatici_tabloyu_yamala(self, hatirlatici_id):
+        # Tüm listeyi yeniden kurmak yerine sadece değişen kuralın satırını ekler, günceller veya siler
+        if self.hatirlatici_filtre is not None and self.hatirlatici_deposu.eslesir_mi(hatirlatici_id, **self.hatirlatici_filtre):
+            self.hatirlatici_tablo.satir_guncelle(hatirlatici_id, self.hatirlatici_satiri(hatirlatici_id))
+        else:
+            self.hatirlatici_tablo.satir_sil(hatirlatici_id)
+
+    def hatirlatici_formu_temizle(self):
+        self.hatirlatici_tablo.secimi_kaldir()
         self.hatirlatici_tip_combo.set("")
         self.hatirlatici_deger_entry.delete(0, tk.END)
         self.hatirlatici_aktif_var.set(False)
         self.hatirlatici_sil_button.configure(state=tk.DISABLED)
         self.hatirlatici_tekrar_combo.set("Bir Kez")
+        self.hatirlatici_ekle_button.configure(text="Ekle/Güncelle")
 
 
     def hatirlatici_ekle_guncelle(self):
@@ -556,26 +2050,22 @@ class TarimTakipApp(ThemedTk):
             return
 
         yeni_hatirlatici = {"tip": tip, "deger": deger, "aktif": aktif, "tekrar": tekrar}
-        index = self.hatirlatici_listbox.curselection()
+        hatirlatici_id = self.hatirlatici_tablo.secili
 
-        if len(index) > 0:
-            index = index[0]
-            self.genel_ayarlar["hatirlaticilar"][parametre][index] = yeni_hatirlatici
-            self.hatirlatici_ekle_button.configure(text="Ekle/Güncelle")
+        if hatirlatici_id is not None:
+            self.hatirlatici_deposu.guncelle(hatirlatici_id, parametre, yeni_hatirlatici)
         else:
-            self.genel_ayarlar["hatirlaticilar"][parametre].append(yeni_hatirlatici)
+            hatirlatici_id = self.hatirlatici_deposu.ekle(parametre, yeni_hatirlatici)
 
         save_genel_ayarlar(self.genel_ayarlar)
-        self.hatirlatici_listbox_guncelle(parametre)
+        self.hatirlatici_tabloyu_yamala(hatirlatici_id)
         messagebox.showinfo("Başarılı", "Hatırlatıcı kaydedildi!")
-        self.hatirlatici_yukle(parametre)
+        self.hatirlatici_formu_temizle()
 
-    def hatirlatici_secim_degisti(self, event=None):
-        index = self.hatirlatici_listbox.curselection()
-        parametre = self.hatirlatici_parametre_combo.get()
-        if len(index) > 0 and parametre:
-            index = index[0]
-            hatirlatici = self.genel_ayarlar["hatirlaticilar"][parametre][index]
+    def hatirlatici_secim_degisti(self, hatirlatici_id=None):
+        if hatirlatici_id is not None:
+            parametre, hatirlatici = self.hatirlatici_deposu.getir(hatirlatici_id)
+            self.hatirlatici_parametre_combo.set(parametre)
             self.hatirlatici_tip_combo.set(hatirlatici["tip"])
             self.hatirlatici_deger_entry.delete(0, tk.END)
             self.hatirlatici_deger_entry.insert(0, str(hatirlatici["deger"]))
@@ -585,112 +2075,49 @@ class TarimTakipApp(ThemedTk):
             self.hatirlatici_sil_button.configure(state=tk.NORMAL)
             self.hatirlatici_ekle_button.configure(text="Güncelle")
         else:
-            self.hatirlatici_sil_button.configure(state=tk.DISABLED)
-            self.hatirlatici_ekle_button.configure(text="Ekle/Güncelle")
+            self.hatirlatici_formu_temizle()
 
-    def hatirlatici_sil_index(self, parametre, index):
+    def hatirlatici_sil_id(self, hatirlatici_id):
         try:
-            del self.genel_ayarlar["hatirlaticilar"][parametre][index]
+            self.hatirlatici_deposu.sil(hatirlatici_id)
             save_genel_ayarlar(self.genel_ayarlar)
 
-            if self.hatirlatici_parametre_combo.get() == parametre:
-                self.hatirlatici_listbox_guncelle(parametre)
-                self.hatirlatici_yukle(parametre)
+            secili_silindi = self.hatirlatici_tablo.secili == hatirlatici_id
+            self.hatirlatici_tablo.satir_sil(hatirlatici_id)
+            if secili_silindi:
+                self.hatirlatici_formu_temizle()
 
-        except (KeyError, IndexError) as e:
+        except (KeyError, ValueError) as e:
             logging.error(f"Hata: Hatırlatıcı silinirken hata oluştu: {e}")
             messagebox.showerror("Hata", "Hatırlatıcı silinirken bir hata oluştu.")
 
     def hatirlatici_sil(self):
-        index = self.hatirlatici_listbox.curselection()
-        parametre = self.hatirlatici_parametre_combo.get()
-        if len(index) > 0 and parametre:
-            index = index[0]
-            self.hatirlatici_sil_index(parametre, index)
+        hatirlatici_id = self.hatirlatici_tablo.secili
+        if hatirlatici_id is not None:
+            self.hatirlatici_sil_id(hatirlatici_id)
             messagebox.showinfo("Başarılı", "Hatırlatıcı silindi!")
 
 
-    def check_single_reminders(self, parametre, parametre_deger, hatirlatici):
-        if hatirlatici["tip"] == "altinda" and parametre_deger < hatirlatici["deger"]:
-            return f"{parametre} değeri {hatirlatici['deger']} değerinin altında! (Şu anki {parametre}: {self.genel_ayarlar['hava_durumu'][parametre]})"
-        elif hatirlatici["tip"] == "ustunde" and parametre_deger > hatirlatici["deger"]:
-            return f"{parametre} değeri {hatirlatici['deger']} değerinin üstünde! (Şu anki {parametre}: {self.genel_ayarlar['hava_durumu'][parametre]})"
-        elif hatirlatici["tip"] == "esit" and parametre_deger == hatirlatici["deger"]:
-            return f"{parametre} değeri {hatirlatici['deger']} değerine eşit! (Şu anki {parametre}: {self.genel_ayarlar['hava_durumu'][parametre]})"
-        return None
-
-    def check_recurring_reminders(self, parametre, parametre_deger, hatirlatici):
-        bugun = datetime.now()
-
-        if hatirlatici["tekrar"] == "Günlük":
-            return self.check_single_reminders(parametre, parametre_deger, hatirlatici)
-        elif hatirlatici["tekrar"] == "Haftalık":
-            if bugun.weekday() == 0:  # Pazartesi ise (0: Pazartesi, 6: Pazar)
-                return self.check_single_reminders(parametre, parametre_deger, hatirlatici)
-        elif hatirlatici["tekrar"] == "Aylık":
-            if bugun.day == 1:  # Ayın 1'i ise
-                return self.check_single_reminders(parametre, parametre_deger, hatirlatici)
-        return None
-
-
-    def get_parametre_deger(self, parametre):
-        hava_durumu = self.genel_ayarlar.get("hava_durumu", {})
-        if parametre in ("Hava Durumu", "Gün Doğumu", "Gün Batımı"):
-            return hava_durumu[parametre]
-        elif parametre == "Rüzgar Hızı":
-            return hava_durumu[parametre]
-        else:
-            #parametre_deger_str = hava_durumu[parametre].split(" ")[0].replace("°C", "").replace("%", "").replace(",", ".")
-            return hava_durumu[parametre]
-
-
     def hava_durumu_kontrol(self):
         hava_durumu = self.genel_ayarlar.get("hava_durumu", {})
         if not hava_durumu:
             return
 
-        for parametre, hatirlaticilar in self.genel_ayarlar.get("hatirlaticilar", {}).items():
-            if parametre not in hava_durumu:
-                continue
-
-            try:
-                parametre_deger = self.get_parametre_deger(parametre)
-
-                for hatirlatici in hatirlaticilar:
-                    if not hatirlatici["aktif"]:
-                        continue
-
-                    uyari_mesaji = None
-
-                    if hatirlatici.get("tekrar") == "Bir Kez":
-                        uyari_mesaji = self.check_single_reminders(parametre, parametre_deger, hatirlatici)
+        tetiklenenler = hatirlaticilari_degerlendir(self.genel_ayarlar.get("hatirlaticilar", {}), hava_durumu, self.toplamlar.degerler(), datetime.now())
+        for parametre, hatirlatici, uyari_mesaji in tetiklenenler:
+            play_notification_sound()
+            cevap = messagebox.askyesnocancel("Hatırlatıcı", f"{uyari_mesaji}\n\nBu hatırlatıcıyı silmek istiyor musunuz?")
+            if cevap is True:
+                if hatirlatici["id"] in self.hatirlatici_deposu.kurallar:
+                    self.hatirlatici_sil_id(hatirlatici["id"])
+                else:
+                    logging.error(f"Silinecek hatırlatıcı listede bulunamadı: {hatirlatici}")
+            elif cevap is False or cevap is None:
+                if hatirlatici.get("tekrar") == "Bir Kez":
+                    if hatirlatici["id"] in self.hatirlatici_deposu.kurallar:
+                        self.hatirlatici_sil_id(hatirlatici["id"])
                     else:
-                        uyari_mesaji = self.check_recurring_reminders(parametre, parametre_deger, hatirlatici)
-
-                    if uyari_mesaji:
-                        play_notification_sound()
-                        cevap = messagebox.askyesnocancel("Hatırlatıcı", f"{uyari_mesaji}\n\nBu hatırlatıcıyı silmek istiyor musunuz?")
-                        if cevap is True:
-                            try:
-                                index = self.genel_ayarlar["hatirlaticilar"][parametre].index(hatirlatici)
-                                self.hatirlatici_sil_index(parametre, index)
-                            except ValueError:
-                                logging.error(f"Silinecek hatırlatıcı listede bulunamadı: {hatirlatici}")
-                        elif cevap is False or cevap is None:
-                            if hatirlatici.get("tekrar") == "Bir Kez":
-                                try:
-                                    index = self.genel_ayarlar["hatirlaticilar"][parametre].index(hatirlatici)
-                                    self.hatirlatici_sil_index(parametre, index)
-
-                                except ValueError:
-                                    logging.error(f"Silinecek/Pasif yapılacak hatırlatıcı listede bulunamadı: {hatirlatici}")
-
-            except (ValueError, TypeError) as e:
-                logging.error(f"Hata: {parametre} için hatırlatıcı kontrolünde hata: {e}")
-                continue
-            except KeyError as e:
-                logging.error(f"Hava durumu verisinde eksik anahtar: {e}")
-                continue
+                        logging.error(f"Silinecek/Pasif yapılacak hatırlatıcı listede bulunamadı: {hatirlatici}")
 
     def calculate_next_date(self, last_date_str, interval):
         if last_date_str:
@@ -739,11 +2166,22 @@ class TarimTakipApp(ThemedTk):
             self.takvim.calevent_create(gelecek_ilaclama, "İlaçlama (Gelecek)", "ilaclama_gelecek")
 
 
+        # Tahmine göre uygun pencereler (parsel sayısı gün başına toplanır)
+        for islem, etiket in (("gubreleme", "Gübreleme"), ("ilaclama", "İlaçlama")):
+            gunler = defaultdict(int)
+            for zaman in self.plan.get(islem, {}).values():
+                gunler[zaman.date()] += 1
+            for gun, adet in gunler.items():
+                self.takvim.calevent_create(gun, f"{etiket} penceresi ({adet} parsel)", f"{islem}_pencere")
+
+
         # Stil ayarları (tag_config)
         self.takvim.tag_config("gubreleme_gecmis", background="green", foreground="white")
         self.takvim.tag_config("gubreleme_gelecek", background="lightgreen", foreground="black")
         self.takvim.tag_config("ilaclama_gecmis", background="blue", foreground="white")
         self.takvim.tag_config("ilaclama_gelecek", background="lightblue", foreground="black")
+        self.takvim.tag_config("gubreleme_pencere", background=COLOR_ACCENT, foreground="black")
+        self.takvim.tag_config("ilaclama_pencere", background="orange", foreground="black")
 
 
     def takvim_tarih_secildi(self, event=None):
@@ -771,10 +2209,20 @@ class TarimTakipApp(ThemedTk):
             elif self.calculate_next_date(son_ilaclama_str, self.ilaclama_data.get("ilac_araligi", 15)) == secilen_tarih:
                 ilaclama_bilgisi = "Sonraki ilaçlama tarihi."
 
-        if not gubreleme_bilgisi and not ilaclama_bilgisi:
+        # Tahmine göre uygun pencereler
+        pencere_bilgisi = []
+        for islem, etiket in (("gubreleme", "gübreleme"), ("ilaclama", "ilaçlama")):
+            plan = self.plan.get(islem, {})
+            adet = sum(1 for zaman in plan.values() if zaman.date() == secilen_tarih)
+            if ANA_PARSEL_ADI in plan and plan[ANA_PARSEL_ADI].date() == secilen_tarih:
+                pencere_bilgisi.append(f"Uygun {etiket} penceresi: {plan[ANA_PARSEL_ADI].strftime('%H:%M')}")
+            if adet:
+                pencere_bilgisi.append(f"{adet} parsel için {etiket} penceresi.")
+
+        if not gubreleme_bilgisi and not ilaclama_bilgisi and not pencere_bilgisi:
             self.takvim_bilgi_label.configure(text="Bu tarihte kayıtlı işlem yok.")
         else:
-             self.takvim_bilgi_label.configure(text=f"{gubreleme_bilgisi}\n{ilaclama_bilgisi}")
+             self.takvim_bilgi_label.configure(text="\n".join(bilgi for bilgi in [gubreleme_bilgisi, ilaclama_bilgisi] + pencere_bilgisi if bilgi))
 
     def yedekle(self):
         try:
@@ -790,6 +2238,82 @@ class TarimTakipApp(ThemedTk):
             logging.error(f"Yedekleme hatası: {e}")
             messagebox.showerror("Hata", f"Yedekleme sırasında bir hata oluştu: {e}")
 
+    def disa_aktar_konumlarini_guncelle(self):
+        konumlar = [konum_anahtari(self.genel_ayarlar["il"], self.genel_ayarlar["ilce"])]
+        konumlar += [anahtar for anahtar in self.izlenen_konum_anahtarlari() if anahtar not in konumlar]
+        self.disa_aktar_konum_combo.configure(values=["Tüm Konumlar"] + konumlar)
+        self.disa_aktar_konum_combo.set("Tüm Konumlar")
+
+    def disa_aktar(self):
+        veri = "islem" if self.disa_aktar_veri_combo.get() == "İşlemler" else "gozlem"
+        konum = self.disa_aktar_konum_combo.get()
+        il, ilce = konum.split("/", 1) if "/" in konum else (None, None)
+        baslangic = self.disa_aktar_baslangic.get_date()
+        bitis = self.disa_aktar_bitis.get_date()
+
+        hedef = filedialog.asksaveasfilename(title="Dışa Aktarma Dosyası", defaultextension=".csv", filetypes=[("CSV", "*.csv"), ("Parquet", "*.parquet")])
+        if not hedef:
+            return
+        bicim = "parquet" if hedef.lower().endswith(".parquet") else "csv"
+
+        self.disa_aktar_button.configure(text="Dışa Aktarılıyor...", state="disabled")
+
+        def bitti(mesaj, hata=False):
+            self.disa_aktar_button.configure(text="Dışa Aktar (CSV/Parquet)", state="normal")
+            if hata:
+                messagebox.showerror("Hata", mesaj)
+            else:
+                messagebox.showinfo("Başarılı", mesaj)
+
+        def disa_aktar_thread():
+            try:
+                adet = gecmisi_disa_aktar(hedef, veri, bicim, il, ilce, baslangic, bitis)
+                self.after(0, lambda: bitti(f"{adet} satır dışa aktarıldı: {hedef}"))
+            except Exception as e:
+                logging.error(f"Dışa aktarma hatası: {e}")
+                self.after(0, lambda mesaj=f"Dışa aktarma sırasında bir hata oluştu: {e}": bitti(mesaj, hata=True))
+
+        threading.Thread(target=disa_aktar_thread, daemon=True).start()
+
+    def tekrar_oynat(self, sentetik=False):
+        il, ilce = self.genel_ayarlar["il"], self.genel_ayarlar["ilce"]
+        if sentetik:
+            gozlemler = sentetik_gozlemler(datetime.now().replace(hour=0, minute=0, second=0, microsecond=0))
+            islemler = ()
+        else:
+            dosya_yolu = filedialog.askopenfilename(title="Gözlem Dosyasını Seçin", initialfile=GOZLEM_GECMISI_FILE, filetypes=[("JSON Lines", "*.jsonl"), ("Tüm dosyalar", "*.*")])
+            if not dosya_yolu:
+                return
+            gozlemler = gozlemleri_oku(dosya_yolu, il, ilce)
+            islemler = islemleri_oku(ISLEM_GECMISI_FILE, il, ilce)
+
+        oynatici = TekrarOynatici(self.genel_ayarlar["hatirlaticilar"])
+        for button in (self.tekrar_oynat_button, self.sentetik_oynat_button):
+            button.configure(state="disabled")
+
+        def bitti(sonuc, hata=None):
+            for button in (self.tekrar_oynat_button, self.sentetik_oynat_button):
+                button.configure(state="normal")
+            if hata:
+                messagebox.showerror("Hata", f"Tekrar oynatma sırasında bir hata oluştu: {hata}")
+                return
+            # Kutuda özet gösterilir; tüm zaman çizelgeleri istenirse JSON olarak kaydedilir
+            rapor = tekrar_oynatma_raporu(sonuc, kural_limiti=10)
+            if messagebox.askyesno("Tekrar Oynatma", f"{rapor}\n\nTam sonucu JSON olarak kaydetmek ister misiniz?"):
+                hedef = filedialog.asksaveasfilename(title="Tekrar Oynatma Sonucu", defaultextension=".json", filetypes=[("JSON", "*.json")])
+                if hedef:
+                    save_data(hedef, sonuc)
+
+        def oynat_thread():
+            try:
+                sonuc = oynatici.oynat(gozlemler, islemler)
+                self.after(0, lambda: bitti(sonuc))
+            except Exception as e:
+                logging.error(f"Tekrar oynatma hatası: {e}")
+                self.after(0, lambda hata=e: bitti(None, hata))
+
+        threading.Thread(target=oynat_thread, daemon=True).start()
+
     def geri_yukle(self):
         try:
             dosya_yolu = filedialog.askdirectory(title="Yedekleme Klasörünü Seçin")
@@ -801,7 +2325,13 @@ class TarimTakipApp(ThemedTk):
 
                 self.gubreleme_data = load_gubreleme_data()
                 self.ilaclama_data = load_ilaclama_data()
+                onceki_konum = (self.genel_ayarlar["il"], self.genel_ayarlar["ilce"])
                 self.genel_ayarlar = load_genel_ayarlar()
+                konum = (self.genel_ayarlar["il"], self.genel_ayarlar["ilce"])
+                if konum != onceki_konum:
+                    self.ana_konum_degisti(konum)
+                    save_genel_ayarlar(self.genel_ayarlar)
+                self.planlari_hesapla()
 
                 messagebox.showinfo("Başarılı", "Veriler başarıyla geri yüklendi!")
 
@@ -809,17 +2339,69 @@ class TarimTakipApp(ThemedTk):
                 self.il_entry.insert(0, self.genel_ayarlar.get("il", "İstanbul"))
                 self.ilce_entry.delete(0, tk.END)
                 self.ilce_entry.insert(0, self.genel_ayarlar.get("ilce", "Kadıköy"))
+                self.pano_yenile()
                 self.guncelle_ve_goster_hava_durumu()
                 self.kalan_sure_label.configure(text=self.kalan_gun_hesapla())
                 self.update_calendar_markings()
-                if self.hatirlatici_parametre_combo.get():
-                    self.hatirlatici_listbox_guncelle(self.hatirlatici_parametre_combo.get())
+                self.hatirlatici_deposu = HatirlaticiDeposu(self.genel_ayarlar)
+                self.hatirlatici_ara()
 
         except Exception as e:
             logging.error(f"Geri yükleme hatası: {e}")
             messagebox.showerror("Hata", f"Geri yükleme sırasında bir hata oluştu: {e}")
 
 
+def komut_satiri_argumanlari(argv=None):
+    parser = argparse.ArgumentParser(description="Gübreleme ve İlaçlama Takip Sistemi")
+    parser.add_argument("--tekrar-oynat", metavar="DOSYA", help=f"Gözlem dosyasını (ör. {GOZLEM_GECMISI_FILE}) arayüzsüz olarak hatırlatıcılardan geçirir; 'sentetik' verilirse üretilen seri kullanılır")
+    parser.add_argument("--il", help="Sadece bu ilin gözlemlerini kullan (tekrar oynatmada varsayılan: kayıtlı ana konum)")
+    parser.add_argument("--ilce", help="Sadece bu ilçenin gözlemlerini kullan (tekrar oynatmada varsayılan: kayıtlı ana konum)")
+    parser.add_argument("--gun", type=int, default=30, help="Sentetik seri uzunluğu (gün)")
+    parser.add_argument("--adim", type=int, default=10, help="Sentetik seri adımı (dakika)")
+    parser.add_argument("--cikti", metavar="DOSYA", help="Tekrar oynatma sonucunu tüm tetiklenme zamanlarıyla JSON olarak kaydet")
+    parser.add_argument("--disa-aktar", metavar="DOSYA", help="Geçmişi arayüzsüz olarak CSV veya Parquet dosyasına aktar (biçim uzantıdan belirlenir)")
+    parser.add_argument("--veri", choices=["gozlem", "islem"], default="gozlem", help="Dışa aktarılacak geçmiş")
+    parser.add_argument("--baslangic", type=date.fromisoformat, help="Dışa aktarma başlangıç tarihi (YYYY-AA-GG, dahil)")
+    parser.add_argument("--bitis", type=date.fromisoformat, help="Dışa aktarma bitiş tarihi (YYYY-AA-GG, dahil)")
+    return parser.parse_args(argv)
+
+
+def tekrar_oynat_komutu(args):
+    ayarlar = load_genel_ayarlar()
+    if args.tekrar_oynat == "sentetik":
+        gozlemler = sentetik_gozlemler(datetime.now().replace(hour=0, minute=0, second=0, microsecond=0), args.gun, args.adim)
+        islemler = ()
+    else:
+        # Toplamlar tek istasyon içindir; konum verilmezse arayüzdeki gibi kayıtlı ana konum oynatılır
+        if bool(args.il) != bool(args.ilce):
+            sys.exit("Tekrar oynatma tek bir konum için yapılır; --il ve --ilce birlikte verilmeli.")
+        il, ilce = (args.il, args.ilce) if args.il else (ayarlar["il"], ayarlar["ilce"])
+        print(f"Konum: {konum_anahtari(il, ilce)}")
+        gozlemler = gozlemleri_oku(args.tekrar_oynat, il, ilce)
+        islemler = islemleri_oku(ISLEM_GECMISI_FILE, il, ilce)
+
+    sonuc = TekrarOynatici(ayarlar["hatirlaticilar"]).oynat(gozlemler, islemler)
+    print(tekrar_oynatma_raporu(sonuc))
+    if args.cikti:
+        save_data(args.cikti, sonuc)
+
+
+def disa_aktar_komutu(args):
+    # Kayıt yoksa, pyarrow eksikse veya hedef yazılamıyorsa iz dökümü yerine mesaj verip hata koduyla çıkar
+    bicim = "parquet" if args.disa_aktar.lower().endswith(".parquet") else "csv"
+    try:
+        adet = gecmisi_disa_aktar(args.disa_aktar, args.veri, bicim, args.il, args.ilce, args.baslangic, args.bitis)
+    except (OSError, RuntimeError) as e:
+        sys.exit(f"Dışa aktarma sırasında bir hata oluştu: {e}")
+    print(f"{adet} satır dışa aktarıldı: {args.disa_aktar}")
+
+
 if __name__ == "__main__":
-    app = TarimTakipApp()
-    app.mainloop()
\ No newline at end of file
+    args = komut_satiri_argumanlari()
+    if args.tekrar_oynat:
+        tekrar_oynat_komutu(args)
+    elif args.disa_aktar:
+        disa_aktar_komutu(args)
+    else:
+        app = TarimTakipApp()
+        app.mainloop()
\ No newline at end of file